@@ -5,8 +5,6 @@ Replaces the standalone FastAPI implementation with Agno's integrated AgentOS
 
 from agno.agent import Agent
 from agno.db.sqlite import SqliteDb
-from agno.models.openai import OpenAIChat
-from agno.models.anthropic import Claude
 from agno.os import AgentOS
 from agno.tools.duckduckgo import DuckDuckGoTools
 from fastapi.middleware.cors import CORSMiddleware
@@ -18,6 +16,7 @@ from dotenv import load_dotenv
 # Load environment variables from .env file
 load_dotenv()
 
+from .agents.models import create_model
 from .agents.tools.restaurant_tools import RestaurantDataTools
 from .agents.tools.menu_tools import MenuExtractionTools
 from .agents.tools.content_tools import ContentGenerationTools
@@ -35,12 +34,15 @@ promo_db = SqliteDb(
     db_file="promo_creator.db",
 )
 
-def create_model(model_provider: str = "openai", model_id: str = "gpt-4o-mini"):
-    """Create the appropriate model based on configuration"""
-    if model_provider == "anthropic":
-        return Claude(id=model_id)
-    else:
-        return OpenAIChat(id=model_id)
+# Toolkits are built once and shared by the specialist agents and the orchestrator,
+# so startup creates a single Places client, Firecrawl client and Pexels session
+restaurant_tools = RestaurantDataTools(google_places_api_key=os.getenv("GOOGLE_PLACES_API_KEY"))
+menu_tools = MenuExtractionTools()
+content_tools = ContentGenerationTools()
+video_tools = VideoProductionTools(
+    pexels_api_key=os.getenv("PEXELS_API_KEY"),
+    elevenlabs_api_key=os.getenv("ELEVENLABS_API_KEY")
+)
 
 # Restaurant Data Agent - Specialized in extracting restaurant information
 restaurant_agent = Agent(
@@ -49,7 +51,7 @@ restaurant_agent = Agent(
     db=promo_db,
     debug_mode=True,
     tools=[
-        RestaurantDataTools(google_places_api_key=os.getenv("GOOGLE_PLACES_API_KEY")),
+        restaurant_tools,
         DuckDuckGoTools()  # For additional research if needed
     ],
     instructions=[
@@ -72,7 +74,7 @@ menu_agent = Agent(
     db=promo_db,
     debug_mode=True,
     tools=[
-        MenuExtractionTools()
+        menu_tools
     ],
     instructions=[
         "You are a menu analysis specialist for restaurant promotional videos.",
@@ -93,7 +95,7 @@ content_creator_agent = Agent(
     db=promo_db,
     debug_mode=True,
     tools=[
-        ContentGenerationTools()
+        content_tools
     ],
     instructions=[
         "You are a video content creation specialist for restaurant promotional videos.",
@@ -136,10 +138,7 @@ video_producer_agent = Agent(
     db=promo_db,
     debug_mode=True,
     tools=[
-        VideoProductionTools(
-            pexels_api_key=os.getenv("PEXELS_API_KEY"),
-            elevenlabs_api_key=os.getenv("ELEVENLABS_API_KEY")
-        )
+        video_tools
     ],
     instructions=[
         "You are a video production specialist for restaurant promotional videos.",
@@ -161,13 +160,10 @@ main_orchestrator = Agent(
     db=promo_db,
     debug_mode=True,
     tools=[
-        RestaurantDataTools(google_places_api_key=os.getenv("GOOGLE_PLACES_API_KEY")),
-        MenuExtractionTools(),
-        ContentGenerationTools(),
-        VideoProductionTools(
-            pexels_api_key=os.getenv("PEXELS_API_KEY"),
-            elevenlabs_api_key=os.getenv("ELEVENLABS_API_KEY")
-        )
+        restaurant_tools,
+        menu_tools,
+        content_tools,
+        video_tools
     ],
     instructions=[
         "You are the main coordinator for AI Promo Creator - a system that generates promotional videos for restaurants.",
@@ -3,11 +3,12 @@
 from .restaurant_agent import RestaurantAgent
 from .menu_agent import MenuAgent
 from .content_agent import ContentAgent
-from .video_agent import VideoAgent
+from .video_agent import VideoAgent, get_video_agent
 
 __all__ = [
     'RestaurantAgent',
     'MenuAgent',
     'ContentAgent',
-    'VideoAgent'
+    'VideoAgent',
+    'get_video_agent'
 ]
\ No newline at end of file
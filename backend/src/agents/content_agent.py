@@ -1,12 +1,25 @@
 from agno.agent import Agent
-from agno.models.openai import OpenAIChat
-from agno.models.anthropic import Claude
+from pydantic import BaseModel, Field
 from typing import Dict, Any
+import asyncio
 import logging
+from .models import create_model
+from .prompt_format import to_prompt_json
+from .rate_limit import LLM_THROTTLE
+from .response_cache import ResponseCache, run_content
 from .tools.content_tools import ContentGenerationTools
 
 logger = logging.getLogger(__name__)
 
+# Generated content keyed by model and prompt, so a repeat request for the same
+# restaurant and style within a week reuses the stored text
+_RESPONSE_CACHE = ResponseCache(maxsize=512, ttl=7 * 86400)
+
+class ContentBundle(BaseModel):
+    """Video script and social media content returned by a single structured LLM call"""
+    script: str = Field(..., description="Complete promotional video script in markdown")
+    social_content: str = Field(..., description="Social media promotional content in markdown")
+
 class ContentAgent:
     """
     Agno-powered agent for generating video scripts and promotional content
@@ -14,10 +27,7 @@ class ContentAgent:
 
     def __init__(self, model_provider: str = "openai", model_id: str = "gpt-4o-mini"):
         # Initialize the appropriate model
-        if model_provider == "anthropic":
-            model = Claude(id=model_id)
-        else:
-            model = OpenAIChat(id=model_id)
+        model = create_model(model_provider, model_id)
 
         # Initialize tools
         self.content_tools = ContentGenerationTools()
@@ -55,54 +65,13 @@ class ContentAgent:
             Dict containing the generated script and metadata
         """
         try:
-            prompt = f"""
-            Create a compelling promotional video script for this restaurant:
-
-            **Restaurant Data:** {restaurant_data}
-            **Menu Data:** {menu_data}
-            **Requested Style:** {style}
-
-            First, use the content generation tools to:
-            1. Prepare the script data and analyze the restaurant information
-            2. Suggest appropriate video styles based on the restaurant type
-            3. Create optimization guidelines for the target duration
-
-            Then create a complete video script with these sections:
-
-            ## HOOK (3-5 seconds)
-            An attention-grabbing opening that makes viewers want to keep watching
-
-            ## MAIN CONTENT (35-50 seconds)
-            - Highlight the restaurant's unique selling points
-            - Feature 2-3 specific menu items with sensory descriptions
-            - Include social proof (ratings, reviews) if strong
-            - Emphasize atmosphere, quality, or value proposition
-
-            ## CALL TO ACTION (5-10 seconds)
-            Clear direction for viewers (visit, call, order) with practical information
-
-            **Writing Guidelines:**
-            - Use conversational, engaging language
-            - Include sensory words that trigger appetite
-            - Create urgency without being pushy
-            - Match the tone to the restaurant's style and target audience
-            - Keep total word count to 100-150 words (30-60 seconds when spoken)
-            - Include natural pauses for visual elements
-
-            **Script Format:**
-            Provide the script with timing cues and visual suggestions:
-            - [VISUAL: description] for video elements
-            - [PAUSE] for natural breaks
-            - **EMPHASIS** for key words/phrases
-
-            End with a brief explanation of why this script approach works for this specific restaurant.
-            """
+            prompt = self._build_script_prompt(restaurant_data, menu_data, style)
 
-            response = await self.agent.arun(prompt)
+            content = await _RESPONSE_CACHE.arun(self.agent, "video_script", prompt)
 
             return {
                 "status": "success",
-                "script": response.content,
+                "script": content,
                 "style": style,
                 "script_generated": True
             }
@@ -127,48 +96,13 @@ class ContentAgent:
             Dict containing social media content variations
         """
         try:
-            prompt = f"""
-            Create social media promotional content for this restaurant:
-
-            **Restaurant Data:** {restaurant_data}
-            **Target Platform:** {target_platform}
-
-            Use the content generation tools to prepare promotional copy data, then create:
-
-            ## POST CAPTIONS
-            Create 3 variations:
-            1. **Short & Punchy** (under 50 characters) - for stories/quick posts
-            2. **Medium Engagement** (50-100 characters) - for main feed posts
-            3. **Detailed Story** (100+ characters) - for community building
-
-            ## HASHTAG SUGGESTIONS
-            Provide relevant hashtags for:
-            - Local discovery
-            - Food type/cuisine
-            - Restaurant experience
-            - Call to action
-
-            ## CALL-TO-ACTION OPTIONS
-            Multiple CTA approaches:
-            - Visit focused
-            - Phone/reservation focused
-            - Online ordering focused
-
-            ## PLATFORM-SPECIFIC ADAPTATIONS
-            Tailor content for {target_platform} best practices:
-            - Optimal posting style
-            - Character limits
-            - Engagement strategies
-            - Visual content suggestions
-
-            Focus on creating scroll-stopping content that drives real visits and orders.
-            """
+            prompt = self._build_social_prompt(restaurant_data, target_platform)
 
-            response = await self.agent.arun(prompt)
+            content = await _RESPONSE_CACHE.arun(self.agent, "social_content", prompt)
 
             return {
                 "status": "success",
-                "social_content": response.content,
+                "social_content": content,
                 "platform": target_platform,
                 "content_created": True
             }
@@ -181,6 +115,72 @@ class ContentAgent:
                 "content_created": False
             }
 
+    async def generate_bundle(self, restaurant_data: Dict[str, Any], menu_data: Dict[str, Any], style: str = "casual", target_platform: str = "instagram") -> Dict[str, Any]:
+        """
+        Generate the video script and social media content together
+
+        Both prompts are sent as one structured request, so the shared restaurant
+        context costs a single round-trip. If that request fails, or either piece is
+        already cached, the two separate calls run concurrently instead.
+
+        Args:
+            restaurant_data: Restaurant information and analysis
+            menu_data: Menu information and featured items
+            style: Video style (casual, professional, trendy, etc.)
+            target_platform: Social media platform (instagram, facebook, tiktok, etc.)
+
+        Returns:
+            Dict containing the script and social content results
+        """
+        script_prompt = self._build_script_prompt(restaurant_data, menu_data, style)
+        social_prompt = self._build_social_prompt(restaurant_data, target_platform)
+        script_key = _RESPONSE_CACHE.agent_key(self.agent, "video_script", script_prompt)
+        social_key = _RESPONSE_CACHE.agent_key(self.agent, "social_content", social_prompt)
+
+        bundle = None
+        if _RESPONSE_CACHE.get(script_key) is None and _RESPONSE_CACHE.get(social_key) is None:
+            try:
+                async with LLM_THROTTLE:
+                    response = await self.agent.arun(
+                        self._build_bundle_prompt(script_prompt, social_prompt),
+                        output_schema=ContentBundle
+                    )
+                bundle = run_content(response)
+                if not isinstance(bundle, ContentBundle):
+                    raise ValueError("Model response did not match the ContentBundle schema")
+            except Exception as e:
+                logger.warning(f"Combined content generation failed, falling back to separate calls: {str(e)}")
+                bundle = None
+
+        if bundle is None:
+            script, social_content = await asyncio.gather(
+                self.generate_video_script(restaurant_data, menu_data, style),
+                self.create_social_media_content(restaurant_data, target_platform)
+            )
+        else:
+            _RESPONSE_CACHE.store_run(script_key, response, bundle.script)
+            _RESPONSE_CACHE.store_run(social_key, response, bundle.social_content)
+            script = {
+                "status": "success",
+                "script": bundle.script,
+                "style": style,
+                "script_generated": True
+            }
+            social_content = {
+                "status": "success",
+                "social_content": bundle.social_content,
+                "platform": target_platform,
+                "content_created": True
+            }
+
+        all_succeeded = script.get("status") == "success" and social_content.get("status") == "success"
+
+        return {
+            "status": "success" if all_succeeded else "error",
+            "script": script,
+            "social_content": social_content
+        }
+
     async def optimize_script_for_duration(self, script_content: str, target_duration: int = 45) -> Dict[str, Any]:
         """
         Optimize script length for target video duration
@@ -218,11 +218,11 @@ class ContentAgent:
             Provide both the optimized script and a brief explanation of the changes made.
             """
 
-            response = await self.agent.arun(prompt)
+            content = await _RESPONSE_CACHE.arun(self.agent, "optimized_script", prompt)
 
             return {
                 "status": "success",
-                "optimized_script": response.content,
+                "optimized_script": content,
                 "target_duration": target_duration,
                 "optimization_completed": True
             }
@@ -233,4 +233,107 @@ class ContentAgent:
                 "status": "error",
                 "error": str(e),
                 "optimization_completed": False
-            }
\ No newline at end of file
+            }
+
+    def _build_script_prompt(self, restaurant_data: Dict[str, Any], menu_data: Dict[str, Any], style: str) -> str:
+        """Build the video script prompt"""
+        prompt = f"""
+        Create a compelling promotional video script for this restaurant:
+
+        **Restaurant Data:** {to_prompt_json(restaurant_data)}
+        **Menu Data:** {to_prompt_json(menu_data)}
+        **Requested Style:** {style}
+
+        First, use the content generation tools to:
+        1. Prepare the script data and analyze the restaurant information
+        2. Suggest appropriate video styles based on the restaurant type
+        3. Create optimization guidelines for the target duration
+
+        Then create a complete video script with these sections:
+
+        ## HOOK (3-5 seconds)
+        An attention-grabbing opening that makes viewers want to keep watching
+
+        ## MAIN CONTENT (35-50 seconds)
+        - Highlight the restaurant's unique selling points
+        - Feature 2-3 specific menu items with sensory descriptions
+        - Include social proof (ratings, reviews) if strong
+        - Emphasize atmosphere, quality, or value proposition
+
+        ## CALL TO ACTION (5-10 seconds)
+        Clear direction for viewers (visit, call, order) with practical information
+
+        **Writing Guidelines:**
+        - Use conversational, engaging language
+        - Include sensory words that trigger appetite
+        - Create urgency without being pushy
+        - Match the tone to the restaurant's style and target audience
+        - Keep total word count to 100-150 words (30-60 seconds when spoken)
+        - Include natural pauses for visual elements
+
+        **Script Format:**
+        Provide the script with timing cues and visual suggestions:
+        - [VISUAL: description] for video elements
+        - [PAUSE] for natural breaks
+        - **EMPHASIS** for key words/phrases
+
+        End with a brief explanation of why this script approach works for this specific restaurant.
+        """
+
+        return prompt
+
+    def _build_social_prompt(self, restaurant_data: Dict[str, Any], target_platform: str) -> str:
+        """Build the social media content prompt"""
+        prompt = f"""
+        Create social media promotional content for this restaurant:
+
+        **Restaurant Data:** {to_prompt_json(restaurant_data)}
+        **Target Platform:** {target_platform}
+
+        Use the content generation tools to prepare promotional copy data, then create:
+
+        ## POST CAPTIONS
+        Create 3 variations:
+        1. **Short & Punchy** (under 50 characters) - for stories/quick posts
+        2. **Medium Engagement** (50-100 characters) - for main feed posts
+        3. **Detailed Story** (100+ characters) - for community building
+
+        ## HASHTAG SUGGESTIONS
+        Provide relevant hashtags for:
+        - Local discovery
+        - Food type/cuisine
+        - Restaurant experience
+        - Call to action
+
+        ## CALL-TO-ACTION OPTIONS
+        Multiple CTA approaches:
+        - Visit focused
+        - Phone/reservation focused
+        - Online ordering focused
+
+        ## PLATFORM-SPECIFIC ADAPTATIONS
+        Tailor content for {target_platform} best practices:
+        - Optimal posting style
+        - Character limits
+        - Engagement strategies
+        - Visual content suggestions
+
+        Focus on creating scroll-stopping content that drives real visits and orders.
+        """
+
+        return prompt
+
+    def _build_bundle_prompt(self, script_prompt: str, social_prompt: str) -> str:
+        """Build the single prompt covering the video script and social content"""
+        prompt = f"""
+        Complete both content tasks below and return them as the fields
+        script and social_content.
+
+        # script
+        {script_prompt}
+
+        # social_content
+        {social_prompt}
+        """
+
+        return prompt
\ No newline at end of file
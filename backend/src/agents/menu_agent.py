@@ -1,12 +1,16 @@
 from agno.agent import Agent
-from agno.models.openai import OpenAIChat
-from agno.models.anthropic import Claude
 from typing import Dict, Any
 import logging
+from .models import create_model
+from .response_cache import ResponseCache
 from .tools.menu_tools import MenuExtractionTools
 
 logger = logging.getLogger(__name__)
 
+# Menu responses keyed by model and prompt; menus change rarely, but prices do,
+# so entries expire after a day
+_RESPONSE_CACHE = ResponseCache(maxsize=512, ttl=86400)
+
 class MenuAgent:
     """
     Agno-powered agent for extracting restaurant menu information
@@ -14,10 +18,7 @@ class MenuAgent:
 
     def __init__(self, model_provider: str = "openai", model_id: str = "gpt-4o-mini"):
         # Initialize the appropriate model
-        if model_provider == "anthropic":
-            model = Claude(id=model_id)
-        else:
-            model = OpenAIChat(id=model_id)
+        model = create_model(model_provider, model_id)
 
         # Initialize tools
         self.menu_tools = MenuExtractionTools()
@@ -71,11 +72,11 @@ class MenuAgent:
             Do not provide analysis, recommendations, or suggestions - just the raw menu data.
             """
 
-            response = await self.agent.arun(prompt)
+            content = await _RESPONSE_CACHE.arun(self.agent, "menu_data", prompt)
 
             return {
                 "status": "success",
-                "menu_data": response.content,
+                "menu_data": content,
                 "menu_extracted": True
             }
 
@@ -0,0 +1,15 @@
+"""
+Model construction shared by the agents
+"""
+
+from agno.models.openai import OpenAIChat
+from agno.models.anthropic import Claude
+
+def create_model(model_provider: str = "openai", model_id: str = "gpt-4o-mini"):
+    """Create the appropriate model based on configuration"""
+    # Each model keeps its SDK's own HTTP client; a process-wide httpx client
+    # stays bound to the first event loop that uses it
+    if model_provider == "anthropic":
+        return Claude(id=model_id)
+    else:
+        return OpenAIChat(id=model_id)
@@ -0,0 +1,19 @@
+"""
+Formatting helpers for data embedded in agent prompts
+"""
+
+from typing import Any
+import orjson
+
+def to_prompt_json(data: Any) -> str:
+    """Render prompt context as compact JSON rather than Python dict repr"""
+    # Text results (e.g. an earlier agent's markdown) go in as-is; JSON-quoting
+    # them would escape every newline
+    if isinstance(data, str):
+        return data
+
+    return orjson.dumps(
+        data,
+        default=str,
+        option=orjson.OPT_NON_STR_KEYS | orjson.OPT_OMIT_MICROSECONDS
+    ).decode()
@@ -0,0 +1,62 @@
+"""
+Shared concurrency and request-rate limit for agent LLM calls
+"""
+
+from typing import Optional
+import asyncio
+import os
+import threading
+import time
+import weakref
+
+class LLMThrottle:
+    """
+    Bounds concurrent agent runs and spaces their starts to a requests-per-minute budget
+
+    One instance is shared by every agent, so running phases concurrently cannot
+    exceed the provider's rate limit. Each asyncio event loop gets its own
+    semaphore, while the rate budget is shared across loops.
+    """
+
+    def __init__(self, max_concurrency: int, requests_per_minute: float):
+        self.max_concurrency = max_concurrency
+        self._interval = 60.0 / requests_per_minute
+        self._next_start = 0.0
+        self._lock = threading.Lock()
+        self._semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+
+    async def __aenter__(self) -> "LLMThrottle":
+        semaphore = self._semaphore()
+        await semaphore.acquire()
+        try:
+            await asyncio.sleep(self._reserve_start())
+        except BaseException:
+            semaphore.release()
+            raise
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> Optional[bool]:
+        self._semaphore().release()
+        return None
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        """Return the semaphore for the running event loop"""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            semaphore = self._semaphores.get(loop)
+            if semaphore is None:
+                semaphore = self._semaphores[loop] = asyncio.BoundedSemaphore(self.max_concurrency)
+            return semaphore
+
+    def _reserve_start(self) -> float:
+        """Claim the next start slot and return how long to wait for it"""
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start)
+            self._next_start = start + self._interval
+        return start - now
+
+LLM_THROTTLE = LLMThrottle(
+    max_concurrency=int(os.getenv("LLM_MAX_CONCURRENCY", "8")),
+    requests_per_minute=float(os.getenv("LLM_REQUESTS_PER_MINUTE", "500"))
+)
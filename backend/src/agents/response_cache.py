@@ -0,0 +1,111 @@
+"""
+In-process cache for agent LLM responses
+"""
+
+from agno.agent import Agent
+from agno.models.response import ToolExecution
+from agno.run.agent import RunOutput
+from agno.run.base import RunStatus
+from cachetools import TTLCache
+from typing import Any, Optional
+import ast
+import hashlib
+import orjson
+import threading
+from .rate_limit import LLM_THROTTLE
+
+def tool_failed(tool: ToolExecution) -> bool:
+    """Whether a tool call raised or returned an error dict"""
+    if tool.tool_call_error:
+        return True
+
+    # Tools return dicts, which agno hands back to the model as their str() repr
+    result = tool.result
+    if not isinstance(result, str) or not result.lstrip().startswith("{"):
+        return False
+    try:
+        parsed = orjson.loads(result)
+    except orjson.JSONDecodeError:
+        try:
+            parsed = ast.literal_eval(result)
+        except (ValueError, SyntaxError, TypeError, MemoryError, RecursionError):
+            return False
+    if not isinstance(parsed, dict):
+        return False
+    if "error" in parsed:
+        return True
+
+    # Batch tools report per-item failures inside their result lists
+    return any(
+        isinstance(item, dict) and "error" in item
+        for value in parsed.values() if isinstance(value, list)
+        for item in value
+    )
+
+def run_succeeded(response: RunOutput) -> bool:
+    """Whether a run completed without any tool call failing"""
+    if response.status != RunStatus.completed:
+        return False
+    return not any(tool_failed(tool) for tool in response.tools or [])
+
+def run_content(response: RunOutput) -> Any:
+    """Return a run's content, raising if the run errored or was cancelled"""
+    # agno reports model failures as a run whose content is the error message
+    if response.status in (RunStatus.error, RunStatus.cancelled):
+        raise RuntimeError(f"Agent run {response.status.value.lower()}: {response.content}")
+    return response.content
+
+class ResponseCache:
+    """
+    Thread-safe TTL cache of LLM text responses keyed by a hash of the request
+
+    The model provider and id are part of every key, so switching models misses
+    the cache instead of returning another model's output. Runs that failed or
+    saw a tool error are not stored, so transient lookup failures are retried.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._cache: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = threading.Lock()
+
+    def key(self, kind: str, model_provider: str, model_id: str, *inputs: Any) -> str:
+        """Hash a request kind, model and prompt inputs into a cache key"""
+        canonical = orjson.dumps(
+            [kind, model_provider, model_id, *inputs],
+            default=str,
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+        )
+        return hashlib.sha256(canonical).hexdigest()
+
+    def agent_key(self, agent: Agent, kind: str, prompt: str) -> str:
+        """Cache key for running a prompt through an agent's model"""
+        return self.key(kind, agent.model.provider, agent.model.id, prompt)
+
+    def get(self, key: str) -> Optional[str]:
+        """Return a cached response, if present"""
+        with self._lock:
+            return self._cache.get(key)
+
+    def store(self, key: str, content: Any) -> None:
+        """Cache a response; only complete text responses are kept"""
+        if isinstance(content, str) and content:
+            with self._lock:
+                self._cache[key] = content
+
+    def store_run(self, key: str, response: RunOutput, content: Any = None) -> None:
+        """Cache a run's response, or the content derived from it, if the run succeeded"""
+        if run_succeeded(response):
+            self.store(key, response.content if content is None else content)
+
+    async def arun(self, agent: Agent, kind: str, prompt: str) -> Any:
+        """Run a prompt through an agent, reusing the cached response for the same model and prompt"""
+        cache_key = self.agent_key(agent, kind, prompt)
+        content = self.get(cache_key)
+
+        if content is None:
+            async with LLM_THROTTLE:
+                response = await agent.arun(prompt)
+            content = run_content(response)
+            self.store_run(cache_key, response)
+
+        return content
@@ -1,13 +1,18 @@
 from agno.agent import Agent
-from agno.models.openai import OpenAIChat
-from agno.models.anthropic import Claude
 from typing import Dict, Any, Optional
 import os
 import logging
-from .tools.restaurant_tools import RestaurantDataTools
+from .models import create_model
+from .prompt_format import to_prompt_json
+from .response_cache import ResponseCache
+from .tools.restaurant_tools import RestaurantDataTools, canonicalize_maps_url
 
 logger = logging.getLogger(__name__)
 
+# Restaurant responses keyed by model and prompt. Ratings and hours drift, so
+# entries expire after a day
+_RESPONSE_CACHE = ResponseCache(maxsize=512, ttl=86400)
+
 class RestaurantAgent:
     """
     Agno-powered agent for extracting and analyzing restaurant information
@@ -15,10 +20,7 @@ class RestaurantAgent:
 
     def __init__(self, model_provider: str = "openai", model_id: str = "gpt-4o-mini"):
         # Initialize the appropriate model
-        if model_provider == "anthropic":
-            model = Claude(id=model_id)
-        else:
-            model = OpenAIChat(id=model_id)
+        model = create_model(model_provider, model_id)
 
         # Initialize tools
         self.restaurant_tools = RestaurantDataTools(
@@ -54,6 +56,9 @@ class RestaurantAgent:
             Dict containing restaurant information and analysis
         """
         try:
+            # Canonical form so tracking suffixes don't defeat the response cache
+            google_maps_url = canonicalize_maps_url(google_maps_url)
+
             prompt = f"""
             Please extract comprehensive restaurant information from this Google Maps URL: {google_maps_url}
 
@@ -71,11 +76,11 @@ class RestaurantAgent:
             Format your response as structured data that can be easily used by other agents.
             """
 
-            response = await self.agent.arun(prompt)
+            content = await _RESPONSE_CACHE.arun(self.agent, "restaurant_data", prompt)
 
             return {
                 "status": "success",
-                "agent_response": response.content,
+                "agent_response": content,
                 "data_extracted": True
             }
 
@@ -99,7 +104,7 @@ class RestaurantAgent:
         """
         try:
             prompt = f"""
-            Based on this restaurant data: {restaurant_data}
+            Based on this restaurant data: {to_prompt_json(restaurant_data)}
 
             Provide a comprehensive analysis for video content creation:
 
@@ -118,11 +123,11 @@ class RestaurantAgent:
             Provide actionable recommendations for the video creation process.
             """
 
-            response = await self.agent.arun(prompt)
+            content = await _RESPONSE_CACHE.arun(self.agent, "restaurant_analysis", prompt)
 
             return {
                 "status": "success",
-                "analysis": response.content,
+                "analysis": content,
                 "recommendations_provided": True
             }
 
@@ -1,14 +1,123 @@
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit, urlunsplit
+import copy
+import hashlib
 import re
+import threading
 import googlemaps
+from cachetools import TTLCache
 import requests
-from bs4 import BeautifulSoup
 from agno.tools import Toolkit
 import os
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Place Details responses keyed by (api key hash, place_id); restaurant metadata
+# rarely changes within an hour, so repeat lookups skip the billable API call
+_DETAILS_CACHE: TTLCache = TTLCache(maxsize=1024, ttl=3600)
+
+# Resolved place_id per (api key hash, name, location) search; a place_id for a
+# given name and area is stable for far longer than its details, so keep a day
+_NAME_TO_PLACE_ID_CACHE: TTLCache = TTLCache(maxsize=2048, ttl=86400)
+
+# Extraction results keyed by (api key hash, canonical Google Maps URL), so the
+# same restaurant shared with different tracking suffixes is looked up once
+_URL_EXTRACTION_CACHE: TTLCache = TTLCache(maxsize=1024, ttl=3600)
+
+# Final URL per goo.gl / maps.app.goo.gl short link; short links never change target
+_SHORT_LINK_CACHE: TTLCache = TTLCache(maxsize=1024, ttl=86400)
+
+# Guards the caches above, which may be shared by concurrent batch lookups
+_PLACES_CACHE_LOCK = threading.Lock()
+
+# Query parameters Google Maps adds for tracking and UI state; they never change
+# which place a URL points at
+_MAPS_TRACKING_PARAMS = frozenset({"hl", "entry", "g_ep", "ved"})
+
+# Values following each Google Maps URL anchor, matched in place right after the
+# anchor. ASCII-only classes that exclude the delimiters, so a match never
+# backtracks past them and Unicode digits never reach float()
+_PLACE_ID_VALUE_RE = re.compile(r'[:=]([A-Za-z0-9_\-]+)', re.ASCII)  # place_id:<id>
+_COORDS_VALUE_RE = re.compile(r'([-0-9.]+),([-0-9.]+)', re.ASCII)  # @<lat>,<lng>
+_DATA_COORDS_VALUE_RE = re.compile(r'([-0-9.]+)!4d([-0-9.]+)', re.ASCII)  # !3d<lat>!4d<lng>
+
+# (result key, Places API field, default) for the flat fields of a place result
+_FIELD_MAP = (
+    ("restaurant_name", "name", ""),
+    ("address", "formatted_address", ""),
+    ("website", "website", ""),
+    ("phone", "formatted_phone_number", ""),
+    ("rating", "rating", 0.0),
+    ("reviews_count", "user_ratings_total", 0),
+    ("price_level", "price_level", None),
+)
+
+
+def canonicalize_maps_url(url: str) -> str:
+    """
+    Normalize a Google Maps URL so links to the same place compare equal.
+
+    Lowercases the scheme and host, drops the fragment and tracking parameters,
+    and sorts the remaining query parameters. Path and parameters are kept
+    byte-for-byte, since re-encoding would hide anchors like 'place_id:' from
+    _parse_maps_url.
+    """
+    parts = urlsplit(url.strip())
+    query = sorted(
+        param for param in parts.query.split("&")
+        if param and param.split("=", 1)[0] not in _MAPS_TRACKING_PARAMS
+    )
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, "&".join(query), ""))
+
+def _parse_maps_url(url: str) -> Optional[Dict[str, Any]]:
+    """
+    Extract a place name or coordinates from a Google Maps URL in linear time.
+
+    Anchors are located with str.find and the value after each anchor is
+    consumed by one anchored match, so the URL is never backtracked over.
+    Lookups are tried in order: an explicit place_id, place name, '@lat,lng'
+    coordinates, then an embedded '!3d<lat>!4d<lng>' pair.
+    """
+    # Explicit place_id: place_id:<id> or (query_)place_id=<id>
+    i = url.find('place_id')
+    while i != -1:
+        match = _PLACE_ID_VALUE_RE.match(url, i + 8)
+        if match:
+            return {"place_id": match.group(1)}
+        i = url.find('place_id', i + 8)
+
+    # Place name: place/<name>/
+    i = url.find('place/')
+    while i != -1:
+        start = i + 6
+        j = url.find('/', start)
+        if j == -1:
+            break
+        if j > start:
+            return {"query": url[start:j].replace('+', ' ')}
+        i = url.find('place/', start)
+
+    # Coordinates: @<lat>,<lng>
+    i = url.find('@')
+    while i != -1:
+        match = _COORDS_VALUE_RE.match(url, i + 1)
+        if match:
+            return {"location": (float(match.group(1)), float(match.group(2)))}
+        i = url.find('@', i + 1)
+
+    # Embedded coordinates: !3d<lat>!4d<lng> inside the data= block
+    i = url.find('!3d')
+    while i != -1:
+        match = _DATA_COORDS_VALUE_RE.match(url, i + 3)
+        if match:
+            return {"location": (float(match.group(1)), float(match.group(2)))}
+        i = url.find('!3d', i + 3)
+
+    return None
+
+
 class RestaurantDataTools(Toolkit):
     """
     Tools for extracting restaurant information from Google Maps URLs
@@ -21,12 +130,14 @@ class RestaurantDataTools(Toolkit):
             raise ValueError("Valid Google Places API key is required for RestaurantDataTools")
 
         self.google_maps_client = googlemaps.Client(key=self.api_key)
+        self._cache_namespace = hashlib.sha256(self.api_key.encode()).hexdigest()[:16]
         logger.info("Google Maps client initialized successfully")
 
         super().__init__(
             name="RestaurantDataTools",
             tools=[
                 self.extract_restaurant_from_maps_url,
+                self.batch_extract_restaurants,
                 self.search_restaurant_by_name,
                 self.get_restaurant_details
             ]
@@ -69,8 +180,15 @@ class RestaurantDataTools(Toolkit):
 
             logger.info(f"Processing Google Maps URL: {google_maps_url}")
 
+            canonical_url = canonicalize_maps_url(google_maps_url)
+            cache_key = (self._cache_namespace, canonical_url)
+            with _PLACES_CACHE_LOCK:
+                cached = _URL_EXTRACTION_CACHE.get(cache_key)
+            if cached is not None:
+                return copy.deepcopy(cached)
+
             # Extract place info from URL
-            place_info = self._extract_place_info_from_url(google_maps_url)
+            place_info = self._extract_place_info_from_url(canonical_url)
 
             if not place_info:
                 return {"error": "Could not extract place information from the provided Google Maps URL. Please check the URL format."}
@@ -78,6 +196,10 @@ class RestaurantDataTools(Toolkit):
             # Get detailed information from Google Places API
             place_details = self._get_place_details(place_info)
 
+            if "error" not in place_details:
+                with _PLACES_CACHE_LOCK:
+                    _URL_EXTRACTION_CACHE[cache_key] = copy.deepcopy(place_details)
+
             logger.info("Successfully extracted restaurant information")
             return place_details
 
@@ -85,6 +207,46 @@ class RestaurantDataTools(Toolkit):
             logger.error(f"Error processing URL: {str(e)}")
             return {"error": str(e)}
 
+    def batch_extract_restaurants(self, google_maps_urls: List[str], max_workers: int = 8) -> Dict[str, Any]:
+        """
+        Extract restaurant information from several Google Maps URLs concurrently.
+
+        This tool fans out extract_restaurant_from_maps_url over a thread pool so the
+        Google Places round-trips for each URL overlap instead of running one after
+        another. Useful for batch flows such as generating videos for a restaurant chain.
+
+        Args:
+            google_maps_urls (List[str]): Google Maps URLs to process. Each URL supports
+                                        the same formats as extract_restaurant_from_maps_url.
+            max_workers (int, optional): Maximum number of concurrent lookups (default 8,
+                                       which stays well within Google's default QPS limit).
+
+        Returns:
+            Dict[str, Any]: Batch results dictionary containing:
+                - restaurants (List[Dict]): One result per input URL, in input order.
+                                          Each entry has the same fields as
+                                          extract_restaurant_from_maps_url, including
+                                          an error message if that URL failed.
+                - total_processed (int): Number of URLs processed
+                - error (str): Error message if the input is invalid
+        """
+        if not isinstance(google_maps_urls, list):
+            return {"error": "Invalid input: google_maps_urls must be a list of URLs"}
+
+        if not google_maps_urls:
+            return {"restaurants": [], "total_processed": 0}
+
+        workers = max(1, min(max_workers, len(google_maps_urls)))
+        logger.info(f"Processing {len(google_maps_urls)} Google Maps URLs with {workers} workers")
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            restaurants = list(executor.map(self.extract_restaurant_from_maps_url, google_maps_urls))
+
+        return {
+            "restaurants": restaurants,
+            "total_processed": len(restaurants)
+        }
+
     def search_restaurant_by_name(self, restaurant_name: str, location: Optional[str] = None) -> Dict[str, Any]:
         """
         Search for a restaurant by name with optional location filtering.
@@ -132,18 +294,26 @@ class RestaurantDataTools(Toolkit):
                 else:
                     return {"error": "Invalid input: location must be a string if provided"}
 
-            logger.info(f"Searching for restaurant: '{query}'")
+            cache_key = (self._cache_namespace, restaurant_name.casefold(), (location or "").casefold())
+            with _PLACES_CACHE_LOCK:
+                place_id = _NAME_TO_PLACE_ID_CACHE.get(cache_key)
 
-            places_result = self.google_maps_client.places(
-                query=query,
-                type="restaurant"
-            )
+            if place_id is None:
+                logger.info(f"Searching for restaurant: '{query}'")
 
-            if not places_result["results"]:
-                suggestion = f"Try searching with a different location or check the spelling of '{restaurant_name}'"
-                return {"error": f"No restaurant found for '{restaurant_name}'. {suggestion}"}
+                places_result = self.google_maps_client.places(
+                    query=query,
+                    type="restaurant"
+                )
+
+                if not places_result["results"]:
+                    suggestion = f"Try searching with a different location or check the spelling of '{restaurant_name}'"
+                    return {"error": f"No restaurant found for '{restaurant_name}'. {suggestion}"}
+
+                place_id = places_result["results"][0]["place_id"]
+                with _PLACES_CACHE_LOCK:
+                    _NAME_TO_PLACE_ID_CACHE[cache_key] = place_id
 
-            place_id = places_result["results"][0]["place_id"]
             return self._get_detailed_place_info(place_id)
 
         except Exception as e:
@@ -201,37 +371,31 @@ class RestaurantDataTools(Toolkit):
 
         # Handle shortened URLs by resolving them first
         if any(short_domain in url.lower() for short_domain in ['goo.gl/maps', 'maps.app.goo.gl']):
+            with _PLACES_CACHE_LOCK:
+                resolved = _SHORT_LINK_CACHE.get(url)
+            if resolved is not None:
+                return _parse_maps_url(resolved)
+
             try:
                 logger.info(f"Resolving shortened URL: {url}")
                 response = requests.head(url, allow_redirects=True, timeout=10)
                 url = response.url
                 logger.info(f"Resolved to: {url}")
+                with _PLACES_CACHE_LOCK:
+                    _SHORT_LINK_CACHE[original_url] = url
             except Exception as e:
                 logger.warning(f"Failed to resolve shortened URL {original_url}: {str(e)}")
                 # Continue with original URL in case it still works
                 url = original_url
 
-        patterns = [
-            r'place/([^/]+)/',  # place name
-            r'@([-\d.]+),([-\d.]+)',  # coordinates
-            r'data=.*!1m.*!3d([-\d.]+)!4d([-\d.]+)',  # embedded coordinates
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, url)
-            if match:
-                if len(match.groups()) == 1:
-                    # Place name
-                    return {"query": match.group(1).replace('+', ' ')}
-                else:
-                    # Coordinates
-                    lat, lng = match.groups()
-                    return {"location": (float(lat), float(lng))}
-
-        return None
+        return _parse_maps_url(url)
 
     def _get_place_details(self, place_info: Dict[str, Any]) -> Dict[str, Any]:
         """Get detailed place information from Google Places API"""
+        if "place_id" in place_info:
+            # The URL already identifies the place, no search needed
+            return self._get_detailed_place_info(place_info["place_id"])
+
         if "query" in place_info:
             # Search by name
             places_result = self.google_maps_client.places(
@@ -259,6 +423,13 @@ class RestaurantDataTools(Toolkit):
 
     def _get_detailed_place_info(self, place_id: str) -> Dict[str, Any]:
         """Get detailed information using place_id"""
+        cache_key = (self._cache_namespace, place_id)
+        with _PLACES_CACHE_LOCK:
+            cached = _DETAILS_CACHE.get(cache_key)
+        if cached is not None:
+            logger.info(f"Using cached details for place_id: {place_id}")
+            return copy.deepcopy(cached)
+
         details = self.google_maps_client.place(
             place_id=place_id,
             fields=[
@@ -268,17 +439,15 @@ class RestaurantDataTools(Toolkit):
             ]
         )
 
-        place = details["result"]
-
-        return {
-            "restaurant_name": place.get("name", ""),
-            "address": place.get("formatted_address", ""),
-            "website": place.get("website", ""),
-            "phone": place.get("formatted_phone_number", ""),
-            "rating": place.get("rating", 0.0),
-            "reviews_count": place.get("user_ratings_total", 0),
-            "place_id": place_id,
-            "price_level": place.get("price_level"),
-            "opening_hours": place.get("opening_hours", {}).get("weekday_text", [])
-        }
+        place_details = self._format_place_details(details["result"], place_id)
+        with _PLACES_CACHE_LOCK:
+            _DETAILS_CACHE[cache_key] = place_details
+        return copy.deepcopy(place_details)
+
+    def _format_place_details(self, place: Dict[str, Any], place_id: str) -> Dict[str, Any]:
+        """Build the restaurant information dictionary from a Places API result"""
+        place_details = {key: place.get(source, default) for key, source, default in _FIELD_MAP}
+        place_details["place_id"] = place_id
+        place_details["opening_hours"] = (place.get("opening_hours") or {}).get("weekday_text", [])
+        return place_details
 
@@ -1,11 +1,169 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterator, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
 from agno.tools import Toolkit
+from cachetools import TTLCache
 import logging
 import os
+import threading
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
+# Stock footage search limits: results returned overall and Pexels page sizes per term
+_MAX_FOOTAGE_RESULTS = 20
+_VIDEOS_PER_TERM = 5
+_IMAGES_PER_TERM = 3
+
+# Parsed Pexels search results keyed by (endpoint, query, per_page). Stock queries
+# like "pizza" or "restaurant dining" recur across videos, so repeats within the
+# hour skip the round-trip and the Pexels quota
+_PEXELS_SEARCH_CACHE: TTLCache = TTLCache(maxsize=1024, ttl=3600)
+_PEXELS_SEARCH_CACHE_LOCK = threading.Lock()
+
+# Caps in-flight Pexels requests across every toolkit instance and search thread, so
+# concurrent video jobs queue here instead of tripping the API's rate limit
+_PEXELS_CONCURRENCY = threading.BoundedSemaphore(8)
+
+# Default ElevenLabs voice settings, overridden per call by voice_settings
+_DEFAULT_VOICE_SETTINGS = {
+    "voice_id": "21m00Tcm4TlvDq8ikWAM",  # Rachel voice
+    "stability": 0.5,
+    "similarity_boost": 0.8,
+    "style": 0.0,
+    "use_speaker_boost": True
+}
+
+# Static outline sections shared by every create_video_outline call. They are
+# built once at import time; every leaf is a str, so each outline gets shallow
+# copies of the containers rather than a deep copy.
+_VIDEO_STRUCTURE = {
+    "intro": {
+        "duration": "3-5 seconds",
+        "purpose": "Hook viewer, show restaurant name",
+        "visual_style": "Eye-catching opening shot"
+    },
+    "main_content": {
+        "duration": "35-50 seconds",
+        "purpose": "Showcase food, atmosphere, unique selling points",
+        "visual_style": "Mix of food shots, interior, customer experience"
+    },
+    "call_to_action": {
+        "duration": "5-10 seconds",
+        "purpose": "Drive action (visit, call, order)",
+        "visual_style": "Contact info, location, clear CTA"
+    }
+}
+
+_AUDIO_REQUIREMENTS = {
+    "voiceover": {
+        "style": "Professional, warm, engaging",
+        "pacing": "Clear and moderate speed",
+        "tone": "Friendly and appetizing"
+    },
+    "background_music": {
+        "style": "Upbeat, light, non-intrusive",
+        "volume": "20-30% of voiceover volume",
+        "genre": "Light jazz, acoustic, or ambient"
+    },
+    "sound_effects": {
+        "cooking_sounds": "Subtle sizzling, chopping",
+        "ambient": "Light restaurant atmosphere",
+        "emphasis": "Soft transitions between sections"
+    }
+}
+
+_PRODUCTION_NOTES = [
+    "Ensure all food shots are well-lit and appetizing",
+    "Keep text overlays readable and on-screen for adequate time",
+    "Maintain consistent color grading throughout",
+    "Use smooth transitions between scenes",
+    "Include restaurant branding (logo, colors) subtly",
+    "Ensure video works well both with and without sound",
+    "Optimize for mobile viewing (vertical/square formats if needed)",
+    "Include captions for accessibility"
+]
+
+# Baseline seconds per production phase, scaled by the outline's complexity multiplier
+_BASE_PHASE_TIMES = {
+    "script_processing": 30,
+    "voiceover_generation": 60,
+    "footage_compilation": 120,
+    "video_editing": 180,
+    "final_rendering": 90
+}
+
+# ASCII scripts at least this long are word-counted with a vectorized byte scan;
+# below it, str.split() measured faster
+_VECTOR_WORD_COUNT_MIN_LENGTH = 32768
+
+# ASCII characters str.split() treats as whitespace
+_ASCII_WHITESPACE_BYTES = (9, 10, 11, 12, 13, 28, 29, 30, 31, 32)
+
+@lru_cache(maxsize=1)
+def _ascii_whitespace_table():
+    """Byte lookup table of _ASCII_WHITESPACE_BYTES, built on first long script"""
+    import numpy as np
+
+    table = np.zeros(128, dtype=bool)
+    table[list(_ASCII_WHITESPACE_BYTES)] = True
+    return table
+
+def _word_count(text: str) -> int:
+    """Count whitespace-separated words, used for spoken-duration estimates"""
+    if len(text) >= _VECTOR_WORD_COUNT_MIN_LENGTH and text.isascii():
+        # Promo scripts never get this long, so NumPy is only imported here
+        import numpy as np
+
+        # A word starts at every non-whitespace byte that follows whitespace
+        is_space = _ascii_whitespace_table()[np.frombuffer(text.encode("ascii"), dtype=np.uint8)]
+        word_starts = np.count_nonzero(is_space[:-1] & ~is_space[1:])
+        return int(word_starts) + (0 if is_space[0] else 1)
+
+    # str.split() runs in C and handles newlines and repeated spaces; it
+    # measured several times faster than counting regex matches
+    return len(text.split())
+
+def _complexity_core(required_shots: int, available_footage: int, has_sound_effects: bool) -> float:
+    """Score production complexity from shot coverage and audio needs"""
+    complexity_score = 1.0
+
+    # Increase complexity if more footage needed
+    if required_shots > available_footage:
+        complexity_score += 0.3
+
+    # Increase complexity for audio requirements
+    if has_sound_effects:
+        complexity_score += 0.2
+
+    return complexity_score
+
+def _copy_media(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Copy footage results so callers and the search cache never share dicts"""
+    # Values are flat except the tags list
+    return [{**item, "tags": list(item["tags"])} for item in items]
+
+def _unique_terms(search_terms: List[str]) -> List[str]:
+    """Drop blank and repeated search terms, keeping the first spelling in order"""
+    unique_terms = {}
+    for term in search_terms:
+        term = term.strip()
+        if term:
+            unique_terms.setdefault(term.casefold(), term)
+    return list(unique_terms.values())
+
+def _unseen_media(items: List[Dict[str, Any]], seen: set) -> Iterator[Dict[str, Any]]:
+    """Yield footage not already suggested under an earlier term, marking it as seen"""
+    for item in items:
+        key = (item["type"], item["id"])
+        if key not in seen:
+            seen.add(key)
+            yield item
+
 class VideoProductionTools(Toolkit):
     """
     Tools for video production and asset management
@@ -15,6 +173,21 @@ class VideoProductionTools(Toolkit):
         self.pexels_api_key = pexels_api_key or os.getenv("PEXELS_API_KEY")
         self.elevenlabs_api_key = elevenlabs_api_key or os.getenv("ELEVENLABS_API_KEY")
 
+        # Shared keep-alive session so Pexels calls reuse pooled TCP/TLS connections
+        self._http = requests.Session()
+        if self.pexels_api_key:
+            self._http.headers["Authorization"] = self.pexels_api_key
+        adapter = HTTPAdapter(
+            pool_connections=8,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.2,
+                status_forcelist=[429, 500, 502, 503, 504]
+            )
+        )
+        self._http.mount("https://", adapter)
+
         super().__init__(
             name="VideoProductionTools",
             tools=[
@@ -41,25 +214,52 @@ class VideoProductionTools(Toolkit):
                 return {"error": "Pexels API key not configured"}
 
             footage_suggestions = []
-
-            for term in search_terms[:5]:  # Limit to 5 searches
-                try:
-                    # Search for videos
-                    video_response = self._search_pexels_videos(term)
-                    if video_response:
-                        footage_suggestions.extend(video_response)
-
-                    # Search for images
-                    image_response = self._search_pexels_images(term)
-                    if image_response:
-                        footage_suggestions.extend(image_response)
-
-                except Exception as e:
-                    logger.warning(f"Search failed for term '{term}': {str(e)}")
-                    continue
+            seen_media = set()
+            pending_terms = _unique_terms(search_terms)[:5]  # Limit to 5 searches
+
+            if pending_terms:
+                with ThreadPoolExecutor(max_workers=len(pending_terms) * 2) as executor:
+                    while pending_terms and len(footage_suggestions) < _MAX_FOOTAGE_RESULTS:
+                        # Hand the remaining slots to terms in order, assuming every
+                        # page comes back full; short pages trigger another wave
+                        budget = _MAX_FOOTAGE_RESULTS - len(footage_suggestions)
+                        searches = []
+                        while pending_terms and budget > 0:
+                            term = pending_terms.pop(0)
+                            video_count = min(_VIDEOS_PER_TERM, budget)
+                            image_count = min(_IMAGES_PER_TERM, budget - video_count)
+                            budget -= video_count + image_count
+                            searches.append((
+                                term,
+                                executor.submit(self._search_pexels_videos, term, video_count),
+                                executor.submit(self._search_pexels_images, term, image_count)
+                                if image_count else None
+                            ))
+
+                        for term, video_future, image_future in searches:
+                            try:
+                                # Search for videos
+                                video_response = video_future.result()
+                                if video_response:
+                                    footage_suggestions.extend(islice(
+                                        _unseen_media(video_response, seen_media),
+                                        _MAX_FOOTAGE_RESULTS - len(footage_suggestions)
+                                    ))
+
+                                # Search for images
+                                image_response = image_future.result() if image_future else None
+                                if image_response:
+                                    footage_suggestions.extend(islice(
+                                        _unseen_media(image_response, seen_media),
+                                        _MAX_FOOTAGE_RESULTS - len(footage_suggestions)
+                                    ))
+
+                            except Exception as e:
+                                logger.warning(f"Search failed for term '{term}': {str(e)}")
+                                continue
 
             return {
-                "footage_suggestions": footage_suggestions[:20],  # Limit results
+                "footage_suggestions": footage_suggestions,
                 "search_terms_used": search_terms,
                 "total_results": len(footage_suggestions)
             }
@@ -86,22 +286,15 @@ class VideoProductionTools(Toolkit):
             if not script_text.strip():
                 return {"error": "No script text provided"}
 
-            # Default voice settings
-            default_settings = {
-                "voice_id": "21m00Tcm4TlvDq8ikWAM",  # Rachel voice
-                "stability": 0.5,
-                "similarity_boost": 0.8,
-                "style": 0.0,
-                "use_speaker_boost": True
-            }
-
-            settings = {**default_settings, **(voice_settings or {})}
+            settings = _DEFAULT_VOICE_SETTINGS.copy()
+            if voice_settings:
+                settings.update(voice_settings)
 
             # Prepare voiceover request data
             voiceover_request = {
                 "script_text": script_text,
                 "voice_settings": settings,
-                "estimated_duration": len(script_text.split()) / 2.5,  # ~2.5 words per second
+                "estimated_duration": _word_count(script_text) / 2.5,  # ~2.5 words per second
                 "character_count": len(script_text),
                 "status": "prepared_for_generation"
             }
@@ -156,19 +349,11 @@ class VideoProductionTools(Toolkit):
             Dict with time estimates for each production phase
         """
         try:
-            base_times = {
-                "script_processing": 30,  # seconds
-                "voiceover_generation": 60,
-                "footage_compilation": 120,
-                "video_editing": 180,
-                "final_rendering": 90
-            }
-
             complexity_multiplier = video_outline.get("estimated_complexity", {}).get("multiplier", 1.0)
 
             estimated_times = {
                 phase: int(time * complexity_multiplier)
-                for phase, time in base_times.items()
+                for phase, time in _BASE_PHASE_TIMES.items()
             }
 
             total_time = sum(estimated_times.values())
@@ -184,21 +369,25 @@ class VideoProductionTools(Toolkit):
             logger.error(f"Error estimating production time: {str(e)}")
             return {"error": str(e)}
 
-    def _search_pexels_videos(self, query: str) -> List[Dict[str, Any]]:
+    def _search_pexels_videos(self, query: str, per_page: int = _VIDEOS_PER_TERM) -> List[Dict[str, Any]]:
         """Search Pexels for videos"""
+        cache_key = ("videos", query, per_page)
+        cached = self._get_cached_search(cache_key)
+        if cached is not None:
+            return cached
+
         try:
-            headers = {"Authorization": self.pexels_api_key}
-            params = {"query": query, "per_page": 5, "orientation": "landscape"}
-
-            response = requests.get(
-                "https://api.pexels.com/videos/search",
-                headers=headers,
-                params=params,
-                timeout=10
-            )
+            params = {"query": query, "per_page": per_page, "orientation": "landscape"}
+
+            with _PEXELS_CONCURRENCY:
+                response = self._http.get(
+                    "https://api.pexels.com/videos/search",
+                    params=params,
+                    timeout=10
+                )
 
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 videos = []
 
                 for video in data.get("videos", []):
@@ -212,6 +401,7 @@ class VideoProductionTools(Toolkit):
                         "description": f"Stock video: {query}"
                     })
 
+                self._store_cached_search(cache_key, videos)
                 return videos
 
         except Exception as e:
@@ -219,21 +409,25 @@ class VideoProductionTools(Toolkit):
 
         return []
 
-    def _search_pexels_images(self, query: str) -> List[Dict[str, Any]]:
+    def _search_pexels_images(self, query: str, per_page: int = _IMAGES_PER_TERM) -> List[Dict[str, Any]]:
         """Search Pexels for images"""
+        cache_key = ("images", query, per_page)
+        cached = self._get_cached_search(cache_key)
+        if cached is not None:
+            return cached
+
         try:
-            headers = {"Authorization": self.pexels_api_key}
-            params = {"query": query, "per_page": 3, "orientation": "landscape"}
-
-            response = requests.get(
-                "https://api.pexels.com/v1/search",
-                headers=headers,
-                params=params,
-                timeout=10
-            )
+            params = {"query": query, "per_page": per_page, "orientation": "landscape"}
+
+            with _PEXELS_CONCURRENCY:
+                response = self._http.get(
+                    "https://api.pexels.com/v1/search",
+                    params=params,
+                    timeout=10
+                )
 
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 images = []
 
                 for photo in data.get("photos", []):
@@ -247,6 +441,7 @@ class VideoProductionTools(Toolkit):
                         "description": f"Stock image: {query}"
                     })
 
+                self._store_cached_search(cache_key, images)
                 return images
 
         except Exception as e:
@@ -254,29 +449,25 @@ class VideoProductionTools(Toolkit):
 
         return []
 
+    def _get_cached_search(self, cache_key: tuple) -> Optional[List[Dict[str, Any]]]:
+        """Return a copy of a cached Pexels search result, if present"""
+        with _PEXELS_SEARCH_CACHE_LOCK:
+            cached = _PEXELS_SEARCH_CACHE.get(cache_key)
+        return _copy_media(cached) if cached is not None else None
+
+    def _store_cached_search(self, cache_key: tuple, results: List[Dict[str, Any]]) -> None:
+        """Cache a successful Pexels search result"""
+        with _PEXELS_SEARCH_CACHE_LOCK:
+            _PEXELS_SEARCH_CACHE[cache_key] = _copy_media(results)
+
     def _create_video_structure(self) -> Dict[str, Any]:
         """Create standard video structure template"""
-        return {
-            "intro": {
-                "duration": "3-5 seconds",
-                "purpose": "Hook viewer, show restaurant name",
-                "visual_style": "Eye-catching opening shot"
-            },
-            "main_content": {
-                "duration": "35-50 seconds",
-                "purpose": "Showcase food, atmosphere, unique selling points",
-                "visual_style": "Mix of food shots, interior, customer experience"
-            },
-            "call_to_action": {
-                "duration": "5-10 seconds",
-                "purpose": "Drive action (visit, call, order)",
-                "visual_style": "Contact info, location, clear CTA"
-            }
-        }
+        return {section: dict(details) for section, details in _VIDEO_STRUCTURE.items()}
 
     def _create_timing_breakdown(self, script_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create timing breakdown based on script"""
-        script_length = len(script_data.get("script_text", "").split()) if script_data.get("script_text") else 100
+        script_text = script_data.get("script_text")
+        script_length = _word_count(script_text) if script_text else 100
         estimated_duration = script_length / 2.5  # words per second
 
         return {
@@ -304,36 +495,11 @@ class VideoProductionTools(Toolkit):
 
     def _analyze_audio_requirements(self, script_data: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze audio requirements"""
-        return {
-            "voiceover": {
-                "style": "Professional, warm, engaging",
-                "pacing": "Clear and moderate speed",
-                "tone": "Friendly and appetizing"
-            },
-            "background_music": {
-                "style": "Upbeat, light, non-intrusive",
-                "volume": "20-30% of voiceover volume",
-                "genre": "Light jazz, acoustic, or ambient"
-            },
-            "sound_effects": {
-                "cooking_sounds": "Subtle sizzling, chopping",
-                "ambient": "Light restaurant atmosphere",
-                "emphasis": "Soft transitions between sections"
-            }
-        }
+        return {section: dict(details) for section, details in _AUDIO_REQUIREMENTS.items()}
 
     def _generate_production_notes(self) -> List[str]:
         """Generate production notes and tips"""
-        return [
-            "Ensure all food shots are well-lit and appetizing",
-            "Keep text overlays readable and on-screen for adequate time",
-            "Maintain consistent color grading throughout",
-            "Use smooth transitions between scenes",
-            "Include restaurant branding (logo, colors) subtly",
-            "Ensure video works well both with and without sound",
-            "Optimize for mobile viewing (vertical/square formats if needed)",
-            "Include captions for accessibility"
-        ]
+        return list(_PRODUCTION_NOTES)
 
     def _estimate_complexity(self, outline: Dict[str, Any]) -> Dict[str, Any]:
         """Estimate production complexity"""
@@ -341,16 +507,13 @@ class VideoProductionTools(Toolkit):
         required_shots = len(visual_requirements.get("required_shots", []))
         available_footage = visual_requirements.get("available_footage", 0)
 
-        complexity_score = 1.0
-
-        # Increase complexity if more footage needed
-        if required_shots > available_footage:
-            complexity_score += 0.3
-
-        # Increase complexity for audio requirements
         audio_requirements = outline.get("audio_requirements", {})
-        if audio_requirements.get("sound_effects"):
-            complexity_score += 0.2
+
+        complexity_score = _complexity_core(
+            required_shots,
+            available_footage,
+            bool(audio_requirements.get("sound_effects"))
+        )
 
         return {
             "score": complexity_score,
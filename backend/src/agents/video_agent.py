@@ -1,46 +1,220 @@
 from agno.agent import Agent
-from agno.models.openai import OpenAIChat
-from agno.models.anthropic import Claude
-from typing import Dict, Any
+from agno.run.agent import RunEvent
+from functools import lru_cache
+from openai import AsyncOpenAI
+from pydantic import BaseModel, Field
+from typing import Dict, Any, AsyncIterator, List, Optional, Tuple
+import asyncio
 import logging
+import orjson
 import os
+import threading
+import weakref
+from .models import create_model
+from .prompt_format import to_prompt_json
+from .rate_limit import LLM_THROTTLE
+from .response_cache import ResponseCache, run_content, tool_failed
 from .tools.video_tools import VideoProductionTools
 
 logger = logging.getLogger(__name__)
 
+# LLM planning responses keyed by a hash of the model and the prompt inputs. The
+# same restaurant and script planned again within a week reuses the stored text
+# instead of paying for another round-trip
+_PLANNING_CACHE = ResponseCache(maxsize=512, ttl=7 * 86400)
+
+# Shared VideoAgents per event loop and (model provider, model id); entries go
+# away with their loop
+_VIDEO_AGENTS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Tuple[str, str], VideoAgent]]" = weakref.WeakKeyDictionary()
+_VIDEO_AGENTS_LOCK = threading.Lock()
+
+_VIDEO_AGENT_INSTRUCTIONS = [
+    "You are a video production specialist for restaurant promotional videos.",
+    "Plan comprehensive video production including footage, audio, and editing requirements.",
+    "Source appropriate stock footage and plan voiceover generation.",
+    "Create detailed production outlines that can be executed efficiently.",
+    "Focus on creating visually appealing content that showcases food in the best light.",
+    "Ensure all technical requirements are met for high-quality video output.",
+    "Provide realistic time estimates and production complexity assessments.",
+    "Optimize for both technical quality and marketing effectiveness."
+]
+
+# Restaurant facts passed to the production summary; other extracted fields are
+# already reflected in the plans it summarizes
+_SUMMARY_RESTAURANT_FIELDS = (
+    "restaurant_name",
+    "address",
+    "website",
+    "phone",
+    "rating",
+    "reviews_count",
+    "price_level",
+    "restaurant_types"
+)
+
+# Restaurant type keyword -> cuisine used for footage search terms, checked in order
+_CUISINE_KEYWORDS = (
+    ("italian", "italian"),
+    ("pizza", "pizza"),
+    ("chinese", "chinese"),
+    ("mexican", "mexican"),
+    ("indian", "indian"),
+    ("japanese", "japanese"),
+    ("thai", "thai"),
+    ("american", "american"),
+    ("burger", "burger"),
+    ("seafood", "seafood"),
+    ("steakhouse", "steak"),
+    ("bakery", "bakery"),
+    ("cafe", "coffee")
+)
+
+@lru_cache(maxsize=1)
+def _get_video_tools() -> VideoProductionTools:
+    """Shared production toolkit, so its pooled Pexels session is built once per process"""
+    return VideoProductionTools(
+        pexels_api_key=os.getenv("PEXELS_API_KEY"),
+        elevenlabs_api_key=os.getenv("ELEVENLABS_API_KEY")
+    )
+
+class FullPlan(BaseModel):
+    """All three planning outputs returned by a single structured LLM call"""
+    production_plan: str = Field(..., description="Complete video production plan in markdown")
+    voiceover_plan: str = Field(..., description="Voiceover preparation plan in markdown")
+    production_summary: str = Field(..., description="Production summary blueprint in markdown")
+
+class BatchPlanner:
+    """
+    Submits planning prompts through the OpenAI Batch API for non-interactive jobs
+    """
+
+    def __init__(self, model_id: str = "gpt-4o-mini", instructions: Optional[List[str]] = None,
+                 poll_interval: float = 5.0, max_poll_interval: float = 60.0):
+        self.client = AsyncOpenAI()
+        self.model_id = model_id
+        self.system_prompt = "\n".join(instructions or [])
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
+
+    async def submit(self, prompts: List[Dict[str, str]]) -> str:
+        """
+        Upload prompts as a batch input file and start a chat completions batch
+
+        Args:
+            prompts: List of {"custom_id": ..., "prompt": ...} entries
+
+        Returns:
+            The batch id
+        """
+        messages_prefix = [{"role": "system", "content": self.system_prompt}] if self.system_prompt else []
+        lines = [
+            orjson.dumps({
+                "custom_id": entry["custom_id"],
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": self.model_id,
+                    "messages": messages_prefix + [{"role": "user", "content": entry["prompt"]}]
+                }
+            })
+            for entry in prompts
+        ]
+
+        batch_file = await self.client.files.create(
+            file=("planning_batch.jsonl", b"\n".join(lines)),
+            purpose="batch"
+        )
+        batch = await self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+
+        logger.info(f"Submitted planning batch {batch.id} with {len(prompts)} requests")
+        return batch.id
+
+    async def poll(self, batch_id: str, max_wait_minutes: float) -> Optional[Dict[str, str]]:
+        """
+        Wait for a batch with exponential backoff and collect its outputs
+
+        Args:
+            batch_id: The batch to wait for
+            max_wait_minutes: Give up after this long
+
+        Returns:
+            Dict mapping custom_id to response content, or None if the batch failed,
+            expired, was cancelled, or did not finish in time
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + max_wait_minutes * 60
+        delay = self.poll_interval
+
+        while True:
+            batch = await self.client.batches.retrieve(batch_id)
+
+            if batch.status == "completed":
+                return await self._collect(batch.output_file_id)
+
+            if batch.status in ("failed", "expired", "cancelling", "cancelled"):
+                logger.warning(f"Planning batch {batch_id} ended with status '{batch.status}'")
+                return None
+
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                logger.warning(f"Planning batch {batch_id} still '{batch.status}' after {max_wait_minutes} minutes")
+                return None
+
+            await asyncio.sleep(min(delay, remaining))
+            delay = min(delay * 2, self.max_poll_interval)
+
+    async def cancel(self, batch_id: str) -> None:
+        """Cancel a batch, ignoring batches that already reached a final state"""
+        try:
+            await self.client.batches.cancel(batch_id)
+        except Exception as e:
+            logger.warning(f"Failed to cancel planning batch {batch_id}: {str(e)}")
+
+    async def _collect(self, output_file_id: Optional[str]) -> Dict[str, str]:
+        """Read the batch output file into a custom_id -> content mapping"""
+        if not output_file_id:
+            return {}
+
+        output = await self.client.files.content(output_file_id)
+        results = {}
+
+        for line in output.text.splitlines():
+            if not line.strip():
+                continue
+            record = orjson.loads(line)
+            response = record.get("response") or {}
+            if response.get("status_code") != 200:
+                logger.warning(f"Batch request {record.get('custom_id')} failed: {record.get('error')}")
+                continue
+            results[record["custom_id"]] = response["body"]["choices"][0]["message"]["content"]
+
+        return results
+
 class VideoAgent:
     """
     Agno-powered agent for video production planning and asset management
     """
 
     def __init__(self, model_provider: str = "openai", model_id: str = "gpt-4o-mini"):
+        self.model_provider = model_provider
+        self.model_id = model_id
+
         # Initialize the appropriate model
-        if model_provider == "anthropic":
-            model = Claude(id=model_id)
-        else:
-            model = OpenAIChat(id=model_id)
+        model = create_model(model_provider, model_id)
 
         # Initialize tools
-        self.video_tools = VideoProductionTools(
-            pexels_api_key=os.getenv("PEXELS_API_KEY"),
-            elevenlabs_api_key=os.getenv("ELEVENLABS_API_KEY")
-        )
+        self.video_tools = _get_video_tools()
 
         # Create the Agno agent
         self.agent = Agent(
             name="Video Production Specialist",
             model=model,
             tools=[self.video_tools],
-            instructions=[
-                "You are a video production specialist for restaurant promotional videos.",
-                "Plan comprehensive video production including footage, audio, and editing requirements.",
-                "Source appropriate stock footage and plan voiceover generation.",
-                "Create detailed production outlines that can be executed efficiently.",
-                "Focus on creating visually appealing content that showcases food in the best light.",
-                "Ensure all technical requirements are met for high-quality video output.",
-                "Provide realistic time estimates and production complexity assessments.",
-                "Optimize for both technical quality and marketing effectiveness."
-            ],
+            instructions=_VIDEO_AGENT_INSTRUCTIONS,
             markdown=True
         )
 
@@ -58,59 +232,19 @@ class VideoAgent:
             Dict containing complete production plan
         """
         try:
-            # Extract key terms for footage search
-            restaurant_name = restaurant_data.get("restaurant_name", "restaurant")
-            cuisine_type = self._extract_cuisine_type(restaurant_data)
-            search_terms = [restaurant_name, cuisine_type, "food", "restaurant", "dining"]
-
-            prompt = f"""
-            Create a comprehensive video production plan for this restaurant promotional video:
-
-            **Script Data:** {script_data}
-            **Restaurant Data:** {restaurant_data}
-
-            Use the video production tools to:
-            1. Search for relevant stock footage using terms: {search_terms}
-            2. Create a detailed video production outline
-            3. Estimate production time and complexity
-
-            Then provide a complete production plan including:
-
-            ## VISUAL PLANNING
-            - **Required Shots**: List all visual elements needed
-            - **Footage Sources**: Stock footage vs. custom shots needed
-            - **Visual Style**: Color scheme, mood, pacing
-            - **Shot Sequence**: How visuals should flow with the script
-
-            ## AUDIO PLANNING
-            - **Voiceover Requirements**: Style, pace, tone specifications
-            - **Background Music**: Genre and mood recommendations
-            - **Sound Effects**: Ambient sounds or emphasis effects
-
-            ## TECHNICAL SPECIFICATIONS
-            - **Video Format**: Resolution, aspect ratio, frame rate
-            - **Duration**: Total video length and section timing
-            - **Text Overlays**: Restaurant name, contact info, CTAs
-            - **Branding Elements**: Logo placement, color scheme
-
-            ## PRODUCTION TIMELINE
-            - **Phase Breakdown**: Each production step with time estimates
-            - **Critical Path**: Which elements must be completed first
-            - **Quality Checkpoints**: What to review at each stage
-
-            ## DELIVERABLES
-            - **Main Video**: Primary promotional video
-            - **Variations**: Different aspect ratios/lengths if needed
-            - **Assets**: All source files and components
-
-            Focus on creating a production plan that delivers maximum impact while being efficient to execute.
-            """
+            cache_key = self._planning_cache_key("production_plan", script_data, restaurant_data)
+            production_plan = _PLANNING_CACHE.get(cache_key)
 
-            response = await self.agent.arun(prompt)
+            if production_plan is None:
+                prompt = self._build_production_prompt(script_data, restaurant_data)
+                async with LLM_THROTTLE:
+                    response = await self.agent.arun(prompt)
+                production_plan = run_content(response)
+                _PLANNING_CACHE.store_run(cache_key, response)
 
             return {
                 "status": "success",
-                "production_plan": response.content,
+                "production_plan": production_plan,
                 "plan_created": True
             }
 
@@ -122,6 +256,69 @@ class VideoAgent:
                 "plan_created": False
             }
 
+    async def stream_plan(self, script_data: Dict[str, Any], restaurant_data: Dict[str, Any]) -> AsyncIterator[str]:
+        """
+        Stream a video production plan as it is generated
+
+        Same prompt as plan_video_production, but content chunks are yielded as the
+        model produces them so callers can render progress before the plan completes.
+        A cached plan is yielded as a single chunk, and a completed stream is cached
+        under the same key plan_video_production uses.
+
+        Args:
+            script_data: Video script and content information
+            restaurant_data: Restaurant information for context
+
+        Yields:
+            Production plan text chunks
+        """
+        cache_key = self._planning_cache_key("production_plan", script_data, restaurant_data)
+        production_plan = _PLANNING_CACHE.get(cache_key)
+        if production_plan is not None:
+            yield production_plan
+            return
+
+        prompt = self._build_production_prompt(script_data, restaurant_data)
+        chunks: asyncio.Queue = asyncio.Queue()
+
+        async def produce():
+            # Drains the model stream into the queue, so the throttle slot is
+            # released when the model finishes rather than when the caller does
+            content: List[str] = []
+            completed = False
+            failed = False
+            try:
+                async with LLM_THROTTLE:
+                    async for event in self.agent.arun(prompt, stream=True, stream_events=True):
+                        if event.event == RunEvent.run_content and isinstance(event.content, str) and event.content:
+                            content.append(event.content)
+                            chunks.put_nowait(event.content)
+                        elif event.event == RunEvent.run_completed:
+                            completed = True
+                        elif event.event == RunEvent.run_error:
+                            raise RuntimeError(f"Agent run error: {event.content}")
+                        elif event.event == RunEvent.run_cancelled:
+                            failed = True
+                        elif event.event in (RunEvent.tool_call_completed, RunEvent.tool_call_error):
+                            # A plan written around a failed tool call is not cached
+                            tool = getattr(event, "tool", None)
+                            failed = failed or tool is None or tool_failed(tool)
+                if completed and not failed:
+                    _PLANNING_CACHE.store(cache_key, "".join(content))
+            except Exception as e:
+                chunks.put_nowait(e)
+            finally:
+                chunks.put_nowait(None)
+
+        producer = asyncio.create_task(produce())
+        try:
+            while (chunk := await chunks.get()) is not None:
+                if isinstance(chunk, Exception):
+                    raise chunk
+                yield chunk
+        finally:
+            producer.cancel()
+
     async def prepare_voiceover_generation(self, script_text: str, voice_style: str = "professional") -> Dict[str, Any]:
         """
         Prepare voiceover generation with optimized settings
@@ -137,43 +334,19 @@ class VideoAgent:
             # Map voice styles to ElevenLabs settings
             voice_settings = self._get_voice_settings(voice_style)
 
-            prompt = f"""
-            Prepare voiceover generation for this script:
-
-            **Script Text:** {script_text}
-            **Voice Style:** {voice_style}
-
-            Use the video production tools to:
-            1. Generate voiceover request with appropriate settings
-            2. Provide optimization recommendations
-
-            Then analyze and recommend:
-
-            ## VOICE CHARACTERISTICS
-            - **Tone**: How the voice should sound (warm, professional, energetic, etc.)
-            - **Pace**: Speaking speed and rhythm
-            - **Emphasis**: Which words/phrases need special emphasis
-            - **Pauses**: Where natural breaks should occur
+            cache_key = self._planning_cache_key("voiceover_plan", script_text, voice_style)
+            voiceover_plan = _PLANNING_CACHE.get(cache_key)
 
-            ## TECHNICAL SETTINGS
-            - **Voice Selection**: Most appropriate voice type
-            - **Audio Quality**: Settings for clear, professional output
-            - **Processing**: Any post-processing needs
-
-            ## SCRIPT OPTIMIZATION FOR VOICE
-            - **Pronunciation Notes**: Difficult words or names
-            - **Breathing Points**: Natural pause locations
-            - **Emotional Cues**: Where tone should change
-            - **Timing Adjustments**: Pacing for visual synchronization
-
-            Ensure the voiceover will sound natural, engaging, and perfectly timed for the video content.
-            """
-
-            response = await self.agent.arun(prompt)
+            if voiceover_plan is None:
+                prompt = self._build_voiceover_prompt(script_text, voice_style)
+                async with LLM_THROTTLE:
+                    response = await self.agent.arun(prompt)
+                voiceover_plan = run_content(response)
+                _PLANNING_CACHE.store_run(cache_key, response)
 
             return {
                 "status": "success",
-                "voiceover_plan": response.content,
+                "voiceover_plan": voiceover_plan,
                 "voice_style": voice_style,
                 "voiceover_prepared": True
             }
@@ -197,10 +370,19 @@ class VideoAgent:
             Dict containing comprehensive production summary
         """
         try:
+            cache_key = self._planning_cache_key("production_summary", production_data)
+            production_summary = _PLANNING_CACHE.get(cache_key)
+            if production_summary is not None:
+                return {
+                    "status": "success",
+                    "production_summary": production_summary,
+                    "summary_generated": True
+                }
+
             prompt = f"""
             Create a comprehensive production summary based on all planning data:
 
-            **Production Data:** {production_data}
+            **Production Data:** {to_prompt_json(production_data)}
 
             Generate a final summary that includes:
 
@@ -235,11 +417,14 @@ class VideoAgent:
             Create a summary that serves as a complete blueprint for video production.
             """
 
-            response = await self.agent.arun(prompt)
+            async with LLM_THROTTLE:
+                response = await self.agent.arun(prompt)
+            production_summary = run_content(response)
+            _PLANNING_CACHE.store_run(cache_key, response)
 
             return {
                 "status": "success",
-                "production_summary": response.content,
+                "production_summary": production_summary,
                 "summary_generated": True
             }
 
@@ -251,30 +436,386 @@ class VideoAgent:
                 "summary_generated": False
             }
 
+    async def plan_all(self, script_data: Dict[str, Any], restaurant_data: Dict[str, Any], script_text: str, voice_style: str = "professional") -> Dict[str, Any]:
+        """
+        Run the full production planning stage
+
+        All three planning outputs are requested in one structured LLM call, so the
+        shared script and restaurant context is sent once. If that call fails, or
+        either plan is already cached, the separate calls run instead.
+
+        Args:
+            script_data: Video script and content information
+            restaurant_data: Restaurant information for context
+            script_text: The script text for voiceover
+            voice_style: Voice style preference
+
+        Returns:
+            Dict containing the production plan, voiceover plan and summary results
+        """
+        try:
+            full_plan = await self._generate_full_plan(script_data, restaurant_data, script_text, voice_style)
+        except Exception as e:
+            logger.warning(f"Combined planning failed, falling back to separate calls: {str(e)}")
+            full_plan = None
+
+        if full_plan is None:
+            return await self._plan_all_separately(script_data, restaurant_data, script_text, voice_style)
+
+        return {
+            "status": "success",
+            "production_plan": {
+                "status": "success",
+                "production_plan": full_plan.production_plan,
+                "plan_created": True
+            },
+            "voiceover_plan": {
+                "status": "success",
+                "voiceover_plan": full_plan.voiceover_plan,
+                "voice_style": voice_style,
+                "voiceover_prepared": True
+            },
+            "production_summary": {
+                "status": "success",
+                "production_summary": full_plan.production_summary,
+                "summary_generated": True
+            }
+        }
+
+    async def plan_all_many(self, jobs: List[Dict[str, Any]], max_concurrency: int = 8) -> List[Dict[str, Any]]:
+        """
+        Run plan_all for several restaurants with bounded concurrency
+
+        A fixed pool of workers pulls jobs in order, so at most max_concurrency
+        plans are in flight and only that many coroutines exist at once, however
+        long the job list is. LLM calls still share the process-wide throttle.
+
+        Args:
+            jobs: plan_all keyword arguments per restaurant (script_data,
+                restaurant_data, script_text and optionally voice_style)
+            max_concurrency: Maximum number of plans run at the same time
+
+        Returns:
+            List of plan_all results in the same order as jobs
+
+        Raises:
+            ValueError: If max_concurrency is less than 1
+        """
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(jobs)
+        pending = iter(enumerate(jobs))
+
+        async def worker():
+            for index, job in pending:
+                try:
+                    results[index] = await self.plan_all(**job)
+                except Exception as e:
+                    logger.error(f"Production planning failed for job {index}: {str(e)}")
+                    results[index] = {"status": "error", "error": str(e)}
+
+        await asyncio.gather(*(worker() for _ in range(min(max_concurrency, len(jobs)))))
+
+        return results
+
+    async def _plan_all_separately(self, script_data: Dict[str, Any], restaurant_data: Dict[str, Any], script_text: str, voice_style: str) -> Dict[str, Any]:
+        """Run the planning calls one prompt at a time, plan and voiceover concurrently"""
+        production_plan, voiceover_plan = await asyncio.gather(
+            self.plan_video_production(script_data, restaurant_data),
+            self.prepare_voiceover_generation(script_text, voice_style),
+            return_exceptions=True
+        )
+
+        # One failing branch must not discard the other's result
+        if isinstance(production_plan, BaseException):
+            logger.error(f"Video production planning failed: {str(production_plan)}")
+            production_plan = {"status": "error", "error": str(production_plan), "plan_created": False}
+        if isinstance(voiceover_plan, BaseException):
+            logger.error(f"Voiceover preparation failed: {str(voiceover_plan)}")
+            voiceover_plan = {"status": "error", "error": str(voiceover_plan), "voiceover_prepared": False}
+
+        return await self._summarize_plans(script_data, restaurant_data, production_plan, voiceover_plan)
+
+    async def plan_all_batched(self, script_data: Dict[str, Any], restaurant_data: Dict[str, Any], script_text: str, voice_style: str = "professional", max_wait_minutes: float = 60) -> Dict[str, Any]:
+        """
+        Run the production planning stage through the OpenAI Batch API
+
+        Intended for non-interactive jobs that can trade latency for the Batch API's
+        lower price. The production plan and voiceover prompts are submitted as one
+        batch; batch requests cannot call tools, so tool-free prompts are used and
+        the plans are cached apart from the tool-backed live plans. The summary
+        depends on both results and runs live afterwards. If the provider is not
+        OpenAI, or the batch fails or is still running after max_wait_minutes, the
+        batch is cancelled and plan_all runs instead.
+
+        Args:
+            script_data: Video script and content information
+            restaurant_data: Restaurant information for context
+            script_text: The script text for voiceover
+            voice_style: Voice style preference
+            max_wait_minutes: How long to wait for the batch before falling back
+
+        Returns:
+            Dict containing the production plan, voiceover plan and summary results,
+            plus the batch_id when the batch path was used
+        """
+        if self.model_provider != "openai":
+            return await self.plan_all(script_data, restaurant_data, script_text, voice_style)
+
+        production_key = self._planning_cache_key("production_plan_batch", script_data, restaurant_data)
+        voiceover_key = self._planning_cache_key("voiceover_plan_batch", script_text, voice_style)
+        outputs = {"production_plan": _PLANNING_CACHE.get(production_key), "voiceover_plan": _PLANNING_CACHE.get(voiceover_key)}
+        batch_id = None
+
+        if outputs["production_plan"] is None or outputs["voiceover_plan"] is None:
+            planner = None
+            outputs = None
+
+            try:
+                planner = BatchPlanner(model_id=self.model_id, instructions=self.agent.instructions)
+                batch_id = await planner.submit([
+                    {"custom_id": "production_plan", "prompt": self._build_production_prompt(script_data, restaurant_data, use_tools=False)},
+                    {"custom_id": "voiceover_plan", "prompt": self._build_voiceover_prompt(script_text, voice_style, use_tools=False)}
+                ])
+                outputs = await planner.poll(batch_id, max_wait_minutes)
+            except Exception as e:
+                logger.error(f"Batch planning failed: {str(e)}")
+
+            if not outputs or "production_plan" not in outputs or "voiceover_plan" not in outputs:
+                if batch_id:
+                    await planner.cancel(batch_id)
+                logger.warning("Batch planning did not complete, falling back to live planning")
+                return await self.plan_all(script_data, restaurant_data, script_text, voice_style)
+
+            _PLANNING_CACHE.store(production_key, outputs["production_plan"])
+            _PLANNING_CACHE.store(voiceover_key, outputs["voiceover_plan"])
+
+        production_plan = {
+            "status": "success",
+            "production_plan": outputs["production_plan"],
+            "plan_created": True
+        }
+        voiceover_plan = {
+            "status": "success",
+            "voiceover_plan": outputs["voiceover_plan"],
+            "voice_style": voice_style,
+            "voiceover_prepared": True
+        }
+
+        result = await self._summarize_plans(script_data, restaurant_data, production_plan, voiceover_plan)
+        result["batch_id"] = batch_id
+        return result
+
+    async def _summarize_plans(self, script_data: Dict[str, Any], restaurant_data: Dict[str, Any], production_plan: Dict[str, Any], voiceover_plan: Dict[str, Any]) -> Dict[str, Any]:
+        """Generate the production summary and combine the planning results"""
+        if production_plan.get("status") == "success" and voiceover_plan.get("status") == "success":
+            production_summary = await self.generate_production_summary(
+                self._production_data(script_data, restaurant_data, production_plan, voiceover_plan)
+            )
+        else:
+            production_summary = {
+                "status": "error",
+                "error": "Production summary skipped because planning did not complete",
+                "summary_generated": False
+            }
+
+        all_succeeded = all(
+            result.get("status") == "success"
+            for result in (production_plan, voiceover_plan, production_summary)
+        )
+
+        return {
+            "status": "success" if all_succeeded else "error",
+            "production_plan": production_plan,
+            "voiceover_plan": voiceover_plan,
+            "production_summary": production_summary
+        }
+
+    async def _generate_full_plan(self, script_data: Dict[str, Any], restaurant_data: Dict[str, Any], script_text: str, voice_style: str) -> Optional[FullPlan]:
+        """Request all three planning outputs in one structured call, caching each field"""
+        production_key = self._planning_cache_key("production_plan", script_data, restaurant_data)
+        voiceover_key = self._planning_cache_key("voiceover_plan", script_text, voice_style)
+
+        # A cached half is reused by the separate path, which then bills only the
+        # missing plan and the summary; the combined call would bill both again
+        if _PLANNING_CACHE.get(production_key) is not None or _PLANNING_CACHE.get(voiceover_key) is not None:
+            return None
+
+        prompt = self._build_full_plan_prompt(script_data, restaurant_data, script_text, voice_style)
+        async with LLM_THROTTLE:
+            response = await self.agent.arun(prompt, output_schema=FullPlan)
+
+        full_plan = run_content(response)
+        if not isinstance(full_plan, FullPlan):
+            raise ValueError("Model response did not match the FullPlan schema")
+
+        production_plan = {"status": "success", "production_plan": full_plan.production_plan, "plan_created": True}
+        voiceover_plan = {"status": "success", "voiceover_plan": full_plan.voiceover_plan, "voice_style": voice_style, "voiceover_prepared": True}
+        summary_key = self._planning_cache_key(
+            "production_summary",
+            self._production_data(script_data, restaurant_data, production_plan, voiceover_plan)
+        )
+
+        _PLANNING_CACHE.store_run(production_key, response, full_plan.production_plan)
+        _PLANNING_CACHE.store_run(voiceover_key, response, full_plan.voiceover_plan)
+        _PLANNING_CACHE.store_run(summary_key, response, full_plan.production_summary)
+
+        return full_plan
+
+    def _production_data(self, script_data: Dict[str, Any], restaurant_data: Dict[str, Any], production_plan: Dict[str, Any], voiceover_plan: Dict[str, Any]) -> Dict[str, Any]:
+        """Collect the planning results the production summary is generated from"""
+        # The summary only needs the plan texts and the facts that identify the
+        # restaurant; status flags, reviews and hours would just be re-sent tokens
+        slim_restaurant = {key: restaurant_data[key] for key in _SUMMARY_RESTAURANT_FIELDS if key in restaurant_data}
+        slim_script = {
+            key: value for key, value in script_data.items()
+            if key not in ("status", "error") and not isinstance(value, bool)
+        }
+
+        return {
+            "restaurant_data": slim_restaurant or restaurant_data,
+            "script_data": slim_script,
+            "production_plan": production_plan.get("production_plan"),
+            "voiceover_plan": voiceover_plan.get("voiceover_plan"),
+            "voice_style": voiceover_plan.get("voice_style")
+        }
+
+    def _planning_cache_key(self, kind: str, *inputs: Any) -> str:
+        """Hash a planning request; the model is part of the key so upgrades miss the cache"""
+        return _PLANNING_CACHE.key(kind, self.model_provider, self.model_id, *inputs)
+
+    def _build_production_prompt(self, script_data: Dict[str, Any], restaurant_data: Dict[str, Any], use_tools: bool = True) -> str:
+        """Build the production planning prompt; without tools, the model plans from the data alone"""
+        # Extract key terms for footage search
+        restaurant_name = restaurant_data.get("restaurant_name", "restaurant")
+        cuisine_type = self._extract_cuisine_type(restaurant_data)
+        search_terms = [restaurant_name, cuisine_type, "food", "restaurant", "dining"]
+
+        # Batch requests cannot call tools, so the tasks are framed as suggestions
+        if use_tools:
+            task_intro, footage_task = "Use the video production tools to:", "Search for relevant stock footage"
+        else:
+            task_intro, footage_task = "Without tool access, plan from the data above:", "Suggest relevant stock footage"
+
+        prompt = f"""
+        Create a comprehensive video production plan for this restaurant promotional video:
+
+        **Script Data:** {to_prompt_json(script_data)}
+        **Restaurant Data:** {to_prompt_json(restaurant_data)}
+
+        {task_intro}
+        1. {footage_task} using terms: {search_terms}
+        2. Create a detailed video production outline
+        3. Estimate production time and complexity
+
+        Then provide a complete production plan including:
+
+        ## VISUAL PLANNING
+        - **Required Shots**: List all visual elements needed
+        - **Footage Sources**: Stock footage vs. custom shots needed
+        - **Visual Style**: Color scheme, mood, pacing
+        - **Shot Sequence**: How visuals should flow with the script
+
+        ## AUDIO PLANNING
+        - **Voiceover Requirements**: Style, pace, tone specifications
+        - **Background Music**: Genre and mood recommendations
+        - **Sound Effects**: Ambient sounds or emphasis effects
+
+        ## TECHNICAL SPECIFICATIONS
+        - **Video Format**: Resolution, aspect ratio, frame rate
+        - **Duration**: Total video length and section timing
+        - **Text Overlays**: Restaurant name, contact info, CTAs
+        - **Branding Elements**: Logo placement, color scheme
+
+        ## PRODUCTION TIMELINE
+        - **Phase Breakdown**: Each production step with time estimates
+        - **Critical Path**: Which elements must be completed first
+        - **Quality Checkpoints**: What to review at each stage
+
+        ## DELIVERABLES
+        - **Main Video**: Primary promotional video
+        - **Variations**: Different aspect ratios/lengths if needed
+        - **Assets**: All source files and components
+
+        Focus on creating a production plan that delivers maximum impact while being efficient to execute.
+        """
+
+        return prompt
+
+    def _build_voiceover_prompt(self, script_text: str, voice_style: str, use_tools: bool = True) -> str:
+        """Build the voiceover preparation prompt; without tools, the model plans from the data alone"""
+        if use_tools:
+            task_intro, request_task = "Use the video production tools to:", "Generate voiceover request"
+        else:
+            task_intro, request_task = "Without tool access, plan from the data above:", "Specify the voiceover request"
+
+        prompt = f"""
+        Prepare voiceover generation for this script:
+
+        **Script Text:** {script_text}
+        **Voice Style:** {voice_style}
+
+        {task_intro}
+        1. {request_task} with appropriate settings
+        2. Provide optimization recommendations
+
+        Then analyze and recommend:
+
+        ## VOICE CHARACTERISTICS
+        - **Tone**: How the voice should sound (warm, professional, energetic, etc.)
+        - **Pace**: Speaking speed and rhythm
+        - **Emphasis**: Which words/phrases need special emphasis
+        - **Pauses**: Where natural breaks should occur
+
+        ## TECHNICAL SETTINGS
+        - **Voice Selection**: Most appropriate voice type
+        - **Audio Quality**: Settings for clear, professional output
+        - **Processing**: Any post-processing needs
+
+        ## SCRIPT OPTIMIZATION FOR VOICE
+        - **Pronunciation Notes**: Difficult words or names
+        - **Breathing Points**: Natural pause locations
+        - **Emotional Cues**: Where tone should change
+        - **Timing Adjustments**: Pacing for visual synchronization
+
+        Ensure the voiceover will sound natural, engaging, and perfectly timed for the video content.
+        """
+
+        return prompt
+
+    def _build_full_plan_prompt(self, script_data: Dict[str, Any], restaurant_data: Dict[str, Any], script_text: str, voice_style: str) -> str:
+        """Build the single prompt covering production plan, voiceover plan and summary"""
+        production_prompt = self._build_production_prompt(script_data, restaurant_data)
+        voiceover_prompt = self._build_voiceover_prompt(script_text, voice_style)
+
+        prompt = f"""
+        Complete all three planning tasks below and return them as the fields
+        production_plan, voiceover_plan and production_summary.
+
+        # production_plan
+        {production_prompt}
+
+        # voiceover_plan
+        {voiceover_prompt}
+
+        # production_summary
+        Create a comprehensive production summary of the two plans above that serves as a
+        complete blueprint for video production, with these sections:
+        EXECUTIVE SUMMARY, PRODUCTION REQUIREMENTS, PRODUCTION CHECKLIST, QUALITY STANDARDS
+        and SUCCESS METRICS.
+        """
+
+        return prompt
+
     def _extract_cuisine_type(self, restaurant_data: Dict[str, Any]) -> str:
         """Extract cuisine type from restaurant data"""
         types = restaurant_data.get("restaurant_types", [])
 
-        # Common cuisine type mapping
-        cuisine_keywords = {
-            "italian": "italian",
-            "pizza": "pizza",
-            "chinese": "chinese",
-            "mexican": "mexican",
-            "indian": "indian",
-            "japanese": "japanese",
-            "thai": "thai",
-            "american": "american",
-            "burger": "burger",
-            "seafood": "seafood",
-            "steakhouse": "steak",
-            "bakery": "bakery",
-            "cafe": "coffee"
-        }
-
         for restaurant_type in types:
-            for keyword, cuisine in cuisine_keywords.items():
-                if keyword in restaurant_type.lower():
+            restaurant_type = restaurant_type.lower()
+            for keyword, cuisine in _CUISINE_KEYWORDS:
+                if keyword in restaurant_type:
                     return cuisine
 
         return "restaurant"  # Default fallback
@@ -308,4 +849,26 @@ class VideoAgent:
             }
         }
 
-        return style_settings.get(voice_style, style_settings["professional"])
\ No newline at end of file
+        return style_settings.get(voice_style, style_settings["professional"])
+
+def get_video_agent(model_provider: str = "openai", model_id: str = "gpt-4o-mini") -> VideoAgent:
+    """
+    Return the shared VideoAgent for a model on the running event loop
+
+    Building a VideoAgent creates the model client and parses tool schemas, so
+    callers handling many requests should reuse one agent per model instead of
+    constructing a new one each time. agno binds a model's client to the event
+    loop that first uses it, so agents are shared per loop; called outside a
+    running loop, this returns a new, unshared agent.
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return VideoAgent(model_provider=model_provider, model_id=model_id)
+
+    with _VIDEO_AGENTS_LOCK:
+        agents = _VIDEO_AGENTS.setdefault(loop, {})
+        agent = agents.get((model_provider, model_id))
+        if agent is None:
+            agent = agents[(model_provider, model_id)] = VideoAgent(model_provider=model_provider, model_id=model_id)
+        return agent
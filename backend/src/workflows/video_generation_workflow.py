@@ -62,6 +62,9 @@ def create_video_generation_workflow(
         name="Video Generation Workflow",
         description="Complete promotional video generation from Google Maps URL to production plan",
         db=db,
+        # Emit step started/completed events on streamed runs so callers can
+        # render each phase's output while later phases are still running
+        stream_events=True,
         steps=[
             restaurant_step,
             menu_step,
@@ -125,6 +128,7 @@ def create_script_only_workflow(
         name="Script Generation Workflow",
         description="Fast video script generation from Google Maps URL",
         db=db,
+        stream_events=True,
         steps=[
             restaurant_step,
             menu_step,
@@ -167,6 +171,7 @@ def create_restaurant_analysis_workflow(
         name="Restaurant Analysis Workflow",
         description="Extract and analyze restaurant data from Google Maps URL",
         db=db,
+        stream_events=True,
         steps=[analysis_step],
         session_state={
             "google_maps_url": "",
@@ -0,0 +1,82 @@
+import asyncio
+
+import pytest
+from agno.run.agent import RunOutput
+from agno.run.base import RunStatus
+
+from src.agents import content_agent
+from src.agents.content_agent import ContentAgent, ContentBundle
+
+RESTAURANT_DATA = {"restaurant_name": "Cafe Roma", "rating": 4.6}
+MENU_DATA = {"featured_items": ["Cacio e pepe", "Tiramisu"]}
+
+
+@pytest.fixture(autouse=True)
+def openai_env(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    content_agent._RESPONSE_CACHE._cache.clear()
+    yield
+    content_agent._RESPONSE_CACHE._cache.clear()
+
+
+def _stub_content_runs(monkeypatch, agent, bundle_content):
+    """Stub agent.arun, recording which kind of content call each prompt was"""
+    calls = []
+
+    async def arun(prompt, output_schema=None):
+        if output_schema is ContentBundle:
+            calls.append("bundle")
+            return RunOutput(content=bundle_content, status=RunStatus.completed)
+        kind = "social_content" if "Create social media promotional content" in prompt else "video_script"
+        calls.append(kind)
+        return RunOutput(content=f"separate {kind}", status=RunStatus.completed)
+
+    monkeypatch.setattr(agent.agent, "arun", arun)
+    return calls
+
+
+def _texts(result):
+    return result["script"]["script"], result["social_content"]["social_content"]
+
+
+def test_generate_bundle_makes_one_combined_call_when_nothing_is_cached(monkeypatch):
+    agent = ContentAgent()
+    calls = _stub_content_runs(monkeypatch, agent, ContentBundle(script="combined script", social_content="combined social"))
+
+    result = asyncio.run(agent.generate_bundle(RESTAURANT_DATA, MENU_DATA))
+
+    assert calls == ["bundle"]
+    assert result["status"] == "success"
+    assert _texts(result) == ("combined script", "combined social")
+
+    # Both halves are cached where the separate calls look for them
+    script = asyncio.run(agent.generate_video_script(RESTAURANT_DATA, MENU_DATA))
+    social = asyncio.run(agent.create_social_media_content(RESTAURANT_DATA))
+    assert calls == ["bundle"]
+    assert (script["script"], social["social_content"]) == ("combined script", "combined social")
+
+
+def test_generate_bundle_falls_back_to_separate_calls_on_schema_mismatch(monkeypatch):
+    agent = ContentAgent()
+    calls = _stub_content_runs(monkeypatch, agent, "plain markdown instead of ContentBundle")
+
+    result = asyncio.run(agent.generate_bundle(RESTAURANT_DATA, MENU_DATA))
+
+    assert calls[0] == "bundle"
+    assert sorted(calls[1:]) == ["social_content", "video_script"]
+    assert result["status"] == "success"
+    assert _texts(result) == ("separate video_script", "separate social_content")
+
+
+def test_generate_bundle_with_one_cached_half_bills_only_the_missing_piece(monkeypatch):
+    agent = ContentAgent()
+    calls = _stub_content_runs(monkeypatch, agent, ContentBundle(script="combined script", social_content="combined social"))
+    script_prompt = agent._build_script_prompt(RESTAURANT_DATA, MENU_DATA, "casual")
+    content_agent._RESPONSE_CACHE.store(
+        content_agent._RESPONSE_CACHE.agent_key(agent.agent, "video_script", script_prompt), "cached script"
+    )
+
+    result = asyncio.run(agent.generate_bundle(RESTAURANT_DATA, MENU_DATA))
+
+    assert calls == ["social_content"]
+    assert _texts(result) == ("cached script", "separate social_content")
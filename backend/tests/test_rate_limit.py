@@ -0,0 +1,80 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from src.agents import rate_limit
+from src.agents.rate_limit import LLMThrottle
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Monotonic clock for the throttle that only moves when a test sets it"""
+    # Replaces the module's time reference only; asyncio keeps the real clock
+    now = [100.0]
+    monkeypatch.setattr(rate_limit, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    return now
+
+
+def test_starts_are_spaced_to_the_requests_per_minute_budget(clock):
+    throttle = LLMThrottle(max_concurrency=8, requests_per_minute=120)
+
+    assert [throttle._reserve_start() for _ in range(3)] == [0.0, 0.5, 1.0]
+
+    # Time spent idle is not banked into a burst
+    clock[0] = 110.0
+    assert [throttle._reserve_start() for _ in range(2)] == [0.0, 0.5]
+
+
+def test_cancelled_waiter_releases_its_slot(clock):
+    throttle = LLMThrottle(max_concurrency=1, requests_per_minute=60)
+
+    async def main():
+        async with throttle:
+            pass
+
+        # The next start must wait a full second for its rate slot; cancel it there
+        waiter = asyncio.create_task(throttle.__aenter__())
+        await asyncio.sleep(0.01)
+        assert throttle._semaphore().locked()
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        assert not throttle._semaphore().locked()
+
+    asyncio.run(main())
+
+
+def test_cancelled_holder_releases_its_slot(clock):
+    throttle = LLMThrottle(max_concurrency=1, requests_per_minute=60_000)
+
+    async def hold(started):
+        async with throttle:
+            started.set()
+            await asyncio.sleep(3600)
+
+    async def main():
+        started = asyncio.Event()
+        holder = asyncio.create_task(hold(started))
+        await started.wait()
+        assert throttle._semaphore().locked()
+
+        holder.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await holder
+
+        await asyncio.wait_for(throttle.__aenter__(), timeout=1)
+        await throttle.__aexit__(None, None, None)
+
+    asyncio.run(main())
+
+
+def test_each_event_loop_gets_its_own_semaphore():
+    throttle = LLMThrottle(max_concurrency=1, requests_per_minute=60_000)
+
+    async def semaphore():
+        async with throttle:
+            return throttle._semaphore()
+
+    assert asyncio.run(semaphore()) is not asyncio.run(semaphore())
@@ -0,0 +1,66 @@
+import pytest
+from agno.models.response import ToolExecution
+from agno.run.agent import RunOutput
+from agno.run.base import RunStatus
+
+from src.agents.response_cache import ResponseCache, run_content, run_succeeded, tool_failed
+
+
+@pytest.mark.parametrize("tool, failed", [
+    # Error dicts, as agno passes them on (str() repr) or as JSON
+    (ToolExecution(result=str({"error": "Pexels API key not configured"})), True),
+    (ToolExecution(result='{"error": "Restaurant not found"}'), True),
+    # A batch result with one failed item
+    (ToolExecution(result=str({
+        "restaurants": [{"restaurant_name": "Cafe Roma"}, {"error": "Restaurant not found"}],
+        "total_processed": 2
+    })), True),
+    # Clean results
+    (ToolExecution(result=str({"restaurant_name": "Cafe Roma", "rating": 4.5, "opening_hours": []})), False),
+    (ToolExecution(result='{"footage_suggestions": [{"id": 1, "tags": ["error"]}], "total_results": 1}'), False),
+    # Strings that are not dicts, including ones that merely mention an error
+    (ToolExecution(result="No error here"), False),
+    (ToolExecution(result='["error"]'), False),
+    (ToolExecution(result="{not a dict"), False),
+    (ToolExecution(result=None), False),
+    # The tool call itself raised
+    (ToolExecution(result="Connection reset", tool_call_error=True), True),
+])
+def test_tool_failed(tool, failed):
+    assert tool_failed(tool) is failed
+
+
+@pytest.mark.parametrize("response, succeeded", [
+    (RunOutput(content="plan", status=RunStatus.completed), True),
+    (RunOutput(content="plan", status=RunStatus.completed, tools=[ToolExecution(result=str({"ok": True}))]), True),
+    (RunOutput(content="plan", status=RunStatus.completed, tools=[ToolExecution(result=str({"error": "x"}))]), False),
+    (RunOutput(content="Connection error.", status=RunStatus.error), False),
+    (RunOutput(content="plan", status=RunStatus.cancelled), False),
+    (RunOutput(content="plan", status=RunStatus.paused), False),
+    (RunOutput(content="plan", status=RunStatus.running), False),
+])
+def test_run_succeeded(response, succeeded):
+    assert run_succeeded(response) is succeeded
+
+
+def test_store_run_skips_failed_runs():
+    cache = ResponseCache(maxsize=8, ttl=60)
+
+    cache.store_run("ok", RunOutput(content="plan", status=RunStatus.completed))
+    cache.store_run("error", RunOutput(content="Connection error.", status=RunStatus.error))
+    cache.store_run("tool", RunOutput(
+        content="I couldn't retrieve the place", status=RunStatus.completed,
+        tools=[ToolExecution(result=str({"error": "Restaurant not found"}))]
+    ))
+    cache.store_run("derived", RunOutput(content=None, status=RunStatus.completed), "script text")
+
+    assert cache.get("ok") == "plan"
+    assert cache.get("error") is None
+    assert cache.get("tool") is None
+    assert cache.get("derived") == "script text"
+
+
+def test_run_content_raises_for_errored_runs():
+    assert run_content(RunOutput(content="plan", status=RunStatus.completed)) == "plan"
+    with pytest.raises(RuntimeError, match="Connection error"):
+        run_content(RunOutput(content="Connection error.", status=RunStatus.error))
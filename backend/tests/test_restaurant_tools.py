@@ -0,0 +1,170 @@
+import pytest
+
+from src.agents.tools import restaurant_tools
+from src.agents.tools.restaurant_tools import RestaurantDataTools, _parse_maps_url, canonicalize_maps_url
+
+FAKE_API_KEY = "AIza" + "x" * 35
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    for cache in (
+        restaurant_tools._DETAILS_CACHE,
+        restaurant_tools._NAME_TO_PLACE_ID_CACHE,
+        restaurant_tools._URL_EXTRACTION_CACHE,
+        restaurant_tools._SHORT_LINK_CACHE,
+    ):
+        cache.clear()
+    yield
+
+
+@pytest.fixture
+def tools():
+    return RestaurantDataTools(google_places_api_key=FAKE_API_KEY)
+
+
+@pytest.mark.parametrize("url, expected", [
+    # Explicit place_id
+    ("https://www.google.com/maps/place/?q=place_id:ChIJN1t_tDeuEmsRUsoyG83frY4",
+     {"place_id": "ChIJN1t_tDeuEmsRUsoyG83frY4"}),
+    ("https://www.google.com/maps/search/?api=1&query=Cafe&query_place_id=ChIJ-abc_123",
+     {"place_id": "ChIJ-abc_123"}),
+    ("https://maps.google.com/?place_id=ChIJabc123&hl=en",
+     {"place_id": "ChIJabc123"}),
+    # place_id wins over a place name and coordinates in the same URL
+    ("https://www.google.com/maps/place/Cafe+Roma/@40.1,-73.2,17z?q=place_id:ChIJroma",
+     {"place_id": "ChIJroma"}),
+    # Place name, with '+' decoded to spaces
+    ("https://www.google.com/maps/place/Joe's+Pizza/@40.7305,-73.9891,17z/data=!3m1!4b1",
+     {"query": "Joe's Pizza"}),
+    ("https://maps.google.com/maps/place/Sushi+Nakazawa/",
+     {"query": "Sushi Nakazawa"}),
+    # A place segment with no trailing slash is not a name; fall back to coordinates
+    ("https://www.google.com/maps/@40.7128,-74.0060,15z/place/Nowhere",
+     {"location": (40.7128, -74.006)}),
+    # Coordinates only
+    ("https://www.google.com/maps/@-33.8688,151.2093,14z",
+     {"location": (-33.8688, 151.2093)}),
+    # Embedded !3d<lat>!4d<lng> pair
+    ("https://www.google.com/maps/search/pizza/data=!4m5!3m4!1s0x0:0x0!8m2!3d40.7305!4d-73.9891",
+     {"location": (40.7305, -73.9891)}),
+    # Unicode digits never reach float()
+    ("https://www.google.com/maps/@٤٠,٧٣,15z", None),
+    # Nothing to extract
+    ("https://www.google.com/maps", None),
+    ("https://www.google.com/maps/place//", None),
+])
+def test_parse_maps_url(url, expected):
+    assert _parse_maps_url(url) == expected
+
+
+@pytest.mark.parametrize("url, expected", [
+    # Tracking parameters and the fragment are dropped
+    ("https://www.google.com/maps/place/Cafe/@1.5,2.5,17z?hl=en&entry=ttu&g_ep=abc&ved=xyz#section",
+     "https://www.google.com/maps/place/Cafe/@1.5,2.5,17z"),
+    # Scheme and host are lowercased, the path is not
+    ("HTTPS://Maps.Google.COM/maps/place/Cafe+Roma/",
+     "https://maps.google.com/maps/place/Cafe+Roma/"),
+    # Remaining parameters are sorted and kept byte-for-byte
+    ("https://maps.google.com/?q=place_id:ChIJabc&cid=123",
+     "https://maps.google.com/?cid=123&q=place_id:ChIJabc"),
+    ("https://maps.google.com/?q=Caf%C3%A9+Roma&hl=fr",
+     "https://maps.google.com/?q=Caf%C3%A9+Roma"),
+    # Surrounding whitespace is stripped
+    ("  https://maps.app.goo.gl/AbC123  ",
+     "https://maps.app.goo.gl/AbC123"),
+])
+def test_canonicalize_maps_url(url, expected):
+    assert canonicalize_maps_url(url) == expected
+
+
+@pytest.mark.parametrize("urls", [
+    [
+        "https://www.google.com/maps/place/?q=place_id:ChIJroma&cid=42",
+        "https://www.google.com/maps/place/?cid=42&hl=en&q=place_id:ChIJroma",
+        "https://WWW.GOOGLE.COM/maps/place/?entry=ttu&cid=42&q=place_id:ChIJroma#top",
+    ],
+    [
+        "https://www.google.com/maps/place/Joe's+Pizza/@40.7305,-73.9891,17z/data=!3m1!4b1",
+        "https://www.google.com/maps/place/Joe's+Pizza/@40.7305,-73.9891,17z/data=!3m1!4b1?entry=ttu&g_ep=EgoyMDI0",
+    ],
+    [
+        "https://www.google.com/maps/search/pizza/data=!3d40.7305!4d-73.9891?ved=1",
+        "https://www.google.com/maps/search/pizza/data=!3d40.7305!4d-73.9891#map",
+    ],
+])
+def test_urls_sharing_a_canonical_key_resolve_to_the_same_place(urls):
+    canonical = {canonicalize_maps_url(url) for url in urls}
+    assert len(canonical) == 1
+
+    place = _parse_maps_url(canonical.pop())
+    assert place is not None
+    assert all(_parse_maps_url(url) == place for url in urls)
+
+
+def test_extraction_is_cached_by_canonical_url(tools, monkeypatch):
+    lookups = []
+
+    def get_place_details(place_info):
+        lookups.append(place_info)
+        return {"restaurant_name": "Cafe Roma", "place_id": place_info["place_id"]}
+
+    monkeypatch.setattr(tools, "_get_place_details", get_place_details)
+
+    first = tools.extract_restaurant_from_maps_url("https://maps.google.com/?q=place_id:ChIJroma&hl=en")
+    second = tools.extract_restaurant_from_maps_url("https://maps.google.com/?entry=ttu&q=place_id:ChIJroma#x")
+
+    assert first == second == {"restaurant_name": "Cafe Roma", "place_id": "ChIJroma"}
+    assert lookups == [{"place_id": "ChIJroma"}]
+
+
+def test_failed_extraction_is_not_cached(tools, monkeypatch):
+    lookups = []
+
+    def get_place_details(place_info):
+        lookups.append(place_info)
+        return {"error": "temporarily unavailable"}
+
+    monkeypatch.setattr(tools, "_get_place_details", get_place_details)
+
+    url = "https://maps.google.com/?q=place_id:ChIJroma"
+    assert "error" in tools.extract_restaurant_from_maps_url(url)
+    assert "error" in tools.extract_restaurant_from_maps_url(url)
+    assert len(lookups) == 2
+
+
+class _Redirect:
+    def __init__(self, url):
+        self.url = url
+
+
+@pytest.mark.parametrize("short_url, resolved_url, expected", [
+    ("https://maps.app.goo.gl/AbC123",
+     "https://www.google.com/maps/place/Cafe+Roma/@40.1,-73.2,17z?entry=ttu",
+     {"query": "Cafe Roma"}),
+    ("https://goo.gl/maps/XyZ789",
+     "https://www.google.com/maps/place/?q=place_id:ChIJroma",
+     {"place_id": "ChIJroma"}),
+])
+def test_short_links_resolve_once(tools, monkeypatch, short_url, resolved_url, expected):
+    resolved = []
+
+    def head(url, allow_redirects, timeout):
+        resolved.append(url)
+        return _Redirect(resolved_url)
+
+    monkeypatch.setattr(restaurant_tools.requests, "head", head)
+
+    assert tools._extract_place_info_from_url(short_url) == expected
+    assert tools._extract_place_info_from_url(short_url) == expected
+    assert resolved == [short_url]
+
+
+def test_unresolvable_short_link_falls_back_to_the_original_url(tools, monkeypatch):
+    def head(url, allow_redirects, timeout):
+        raise ConnectionError("offline")
+
+    monkeypatch.setattr(restaurant_tools.requests, "head", head)
+
+    assert tools._extract_place_info_from_url("https://maps.app.goo.gl/AbC123") is None
+    assert len(restaurant_tools._SHORT_LINK_CACHE) == 0
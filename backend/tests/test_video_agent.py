@@ -0,0 +1,234 @@
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from agno.run.agent import RunOutput
+from agno.run.base import RunStatus
+
+from src.agents import video_agent
+from src.agents.video_agent import get_video_agent
+
+
+@pytest.fixture(autouse=True)
+def openai_env(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    video_agent._PLANNING_CACHE._cache.clear()
+    yield
+    video_agent._PLANNING_CACHE._cache.clear()
+
+
+class _ChatCompletionHandler(BaseHTTPRequestHandler):
+    # Keep-alive, so pooled connections outlive a single event loop
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        body = json.dumps({
+            "id": "chatcmpl-test",
+            "object": "chat.completion",
+            "created": 0,
+            "model": "gpt-4o-mini",
+            "choices": [{
+                "index": 0,
+                "finish_reason": "stop",
+                "message": {"role": "assistant", "content": "## Production plan"}
+            }],
+            "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2}
+        }).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def fake_openai(monkeypatch):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ChatCompletionHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setenv("OPENAI_BASE_URL", f"http://127.0.0.1:{server.server_port}/v1")
+    yield
+    server.shutdown()
+    server.server_close()
+
+
+def test_get_video_agent_is_shared_within_a_loop_only():
+    async def agents():
+        return get_video_agent(), get_video_agent(), get_video_agent("openai", "gpt-4o")
+
+    first, same, other_model = asyncio.run(agents())
+    second, _, _ = asyncio.run(agents())
+
+    assert first is same
+    assert first is not other_model
+    assert first is not second
+
+
+def test_get_video_agent_plans_across_event_loops(fake_openai):
+    async def plan(index):
+        return await get_video_agent().plan_video_production(
+            {"script_text": f"Script {index}"}, {"restaurant_name": "Cafe Roma"}
+        )
+
+    for index in range(3):
+        result = asyncio.run(plan(index))
+        assert result["status"] == "success", result
+        assert result["production_plan"] == "## Production plan"
+
+
+def test_failed_run_is_reported_as_an_error():
+    agent = get_video_agent()
+    agent.agent.model.base_url = "http://127.0.0.1:9/v1"
+    agent.agent.model.max_retries = 0
+
+    result = asyncio.run(agent.plan_video_production({"script_text": "Script"}, {"restaurant_name": "Cafe Roma"}))
+
+    assert result["status"] == "error"
+    assert result["plan_created"] is False
+
+
+def _agent_with_summary(monkeypatch):
+    agent = video_agent.VideoAgent()
+
+    async def summarize(script_data, restaurant_data, production_plan, voiceover_plan):
+        return {"status": "success", "production_plan": production_plan, "voiceover_plan": voiceover_plan}
+
+    monkeypatch.setattr(agent, "_summarize_plans", summarize)
+    return agent
+
+
+def test_plan_all_batched_falls_back_when_the_batch_client_cannot_be_built(monkeypatch):
+    agent = _agent_with_summary(monkeypatch)
+
+    def broken_planner(**kwargs):
+        raise RuntimeError("The api_key client option must be set")
+
+    async def plan_all(*args):
+        return {"status": "success", "path": "live"}
+
+    monkeypatch.setattr(video_agent, "BatchPlanner", broken_planner)
+    monkeypatch.setattr(agent, "plan_all", plan_all)
+
+    result = asyncio.run(agent.plan_all_batched({"script_text": "Script"}, {"restaurant_name": "Cafe Roma"}, "Script"))
+
+    assert result == {"status": "success", "path": "live"}
+
+
+def test_plan_all_batched_caches_apart_from_live_plans(monkeypatch):
+    agent = _agent_with_summary(monkeypatch)
+    submitted = []
+
+    class FakePlanner:
+        def __init__(self, **kwargs):
+            pass
+
+        async def submit(self, prompts):
+            submitted.append(prompts)
+            return "batch_1"
+
+        async def poll(self, batch_id, max_wait_minutes):
+            return {"production_plan": "batch production", "voiceover_plan": "batch voiceover"}
+
+    monkeypatch.setattr(video_agent, "BatchPlanner", FakePlanner)
+    script_data, restaurant_data = {"script_text": "Script"}, {"restaurant_name": "Cafe Roma"}
+
+    first = asyncio.run(agent.plan_all_batched(script_data, restaurant_data, "Script"))
+    second = asyncio.run(agent.plan_all_batched(script_data, restaurant_data, "Script"))
+
+    assert len(submitted) == 1
+    assert all("video production tools" not in entry["prompt"] for entry in submitted[0])
+    assert first["batch_id"] == "batch_1" and second["batch_id"] is None
+    assert second["production_plan"]["production_plan"] == "batch production"
+    assert video_agent._PLANNING_CACHE.get(agent._planning_cache_key("production_plan", script_data, restaurant_data)) is None
+    assert video_agent._PLANNING_CACHE.get(agent._planning_cache_key("voiceover_plan", "Script", "professional")) is None
+
+
+SCRIPT_DATA = {"script_text": "Fresh pasta every day"}
+RESTAURANT_DATA = {"restaurant_name": "Cafe Roma", "rating": 4.6}
+
+
+def _stub_planning_runs(monkeypatch, agent, full_plan_content):
+    """Stub agent.arun, recording which kind of planning call each prompt was"""
+    calls = []
+
+    async def arun(prompt, output_schema=None):
+        if output_schema is video_agent.FullPlan:
+            calls.append("full_plan")
+            return RunOutput(content=full_plan_content, status=RunStatus.completed)
+        if "Prepare voiceover generation" in prompt:
+            kind = "voiceover_plan"
+        elif "Create a comprehensive production summary" in prompt:
+            kind = "production_summary"
+        else:
+            kind = "production_plan"
+        calls.append(kind)
+        return RunOutput(content=f"separate {kind}", status=RunStatus.completed)
+
+    monkeypatch.setattr(agent.agent, "arun", arun)
+    return calls
+
+
+def _plan_texts(result):
+    return (
+        result["production_plan"]["production_plan"],
+        result["voiceover_plan"]["voiceover_plan"],
+        result["production_summary"]["production_summary"],
+    )
+
+
+def test_plan_all_makes_one_combined_call_when_nothing_is_cached(monkeypatch):
+    agent = video_agent.VideoAgent()
+    full_plan = video_agent.FullPlan(
+        production_plan="combined production", voiceover_plan="combined voiceover", production_summary="combined summary"
+    )
+    calls = _stub_planning_runs(monkeypatch, agent, full_plan)
+
+    result = asyncio.run(agent.plan_all(SCRIPT_DATA, RESTAURANT_DATA, "Fresh pasta every day"))
+
+    assert calls == ["full_plan"]
+    assert result["status"] == "success"
+    assert _plan_texts(result) == ("combined production", "combined voiceover", "combined summary")
+
+    # Every field is cached where the separate path looks for it, the summary
+    # under the key derived from _production_data
+    separate = asyncio.run(agent._plan_all_separately(SCRIPT_DATA, RESTAURANT_DATA, "Fresh pasta every day", "professional"))
+    assert calls == ["full_plan"]
+    assert _plan_texts(separate) == ("combined production", "combined voiceover", "combined summary")
+
+
+def test_plan_all_falls_back_to_separate_calls_on_schema_mismatch(monkeypatch):
+    agent = video_agent.VideoAgent()
+    calls = _stub_planning_runs(monkeypatch, agent, "plain markdown instead of FullPlan")
+
+    result = asyncio.run(agent.plan_all(SCRIPT_DATA, RESTAURANT_DATA, "Fresh pasta every day"))
+
+    assert calls[0] == "full_plan"
+    assert sorted(calls[1:3]) == ["production_plan", "voiceover_plan"]
+    assert calls[3:] == ["production_summary"]
+    assert result["status"] == "success"
+    assert _plan_texts(result) == ("separate production_plan", "separate voiceover_plan", "separate production_summary")
+
+
+def test_plan_all_with_one_cached_half_bills_only_the_missing_plan(monkeypatch):
+    agent = video_agent.VideoAgent()
+    full_plan = video_agent.FullPlan(
+        production_plan="combined production", voiceover_plan="combined voiceover", production_summary="combined summary"
+    )
+    calls = _stub_planning_runs(monkeypatch, agent, full_plan)
+    video_agent._PLANNING_CACHE.store(
+        agent._planning_cache_key("production_plan", SCRIPT_DATA, RESTAURANT_DATA), "cached production"
+    )
+
+    result = asyncio.run(agent.plan_all(SCRIPT_DATA, RESTAURANT_DATA, "Fresh pasta every day"))
+
+    assert calls == ["voiceover_plan", "production_summary"]
+    assert _plan_texts(result) == ("cached production", "separate voiceover_plan", "separate production_summary")
+    assert video_agent._PLANNING_CACHE.get(
+        agent._planning_cache_key("production_plan", SCRIPT_DATA, RESTAURANT_DATA)
+    ) == "cached production"
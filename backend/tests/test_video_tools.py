@@ -0,0 +1,166 @@
+import orjson
+import pytest
+
+from src.agents.tools import video_tools
+from src.agents.tools.video_tools import _VECTOR_WORD_COUNT_MIN_LENGTH, VideoProductionTools, _word_count
+
+
+@pytest.fixture(autouse=True)
+def clear_search_cache():
+    video_tools._PEXELS_SEARCH_CACHE.clear()
+    yield
+    video_tools._PEXELS_SEARCH_CACHE.clear()
+
+
+@pytest.fixture
+def tools():
+    return VideoProductionTools(pexels_api_key="pexels-test", elevenlabs_api_key="elevenlabs-test")
+
+
+def _long(text: str) -> str:
+    """Repeat text until it reaches the vectorized word count path"""
+    return text * (_VECTOR_WORD_COUNT_MIN_LENGTH // len(text) + 1)
+
+
+@pytest.mark.parametrize("text", [
+    _long("word "),
+    _long(" leading and trailing "),
+    _long("tabs\tand\nnewlines\r\nmixed \x0b\x0c together  "),
+    _long("separators\x1cfile\x1dgroup\x1erecord\x1funit "),
+    _long("   "),
+    _long("x"),
+    _long("a") + " " + _long("b"),
+])
+def test_word_count_matches_split_for_long_text(text):
+    assert len(text) >= _VECTOR_WORD_COUNT_MIN_LENGTH
+    assert _word_count(text) == len(text.split())
+
+
+@pytest.mark.parametrize("text", ["", "one", "  two  words ", "tab\tnew\nline", "café au lait"])
+def test_word_count_matches_split_for_short_text(text):
+    assert _word_count(text) == len(text.split())
+
+
+def test_word_count_non_ascii_long_text_uses_split():
+    text = _long("crème brûlée ")
+    assert _word_count(text) == len(text.split())
+
+
+
+class _PexelsResponse:
+    status_code = 200
+
+    def __init__(self, payload):
+        self.content = orjson.dumps(payload)
+
+
+def test_cached_search_results_are_copied(tools, monkeypatch):
+    requests_made = []
+
+    def get(url, params, timeout):
+        requests_made.append(params)
+        return _PexelsResponse({"videos": [
+            {"id": 1, "video_files": [{"link": "https://v/1.mp4"}], "image": "https://v/1.jpg", "duration": 8}
+        ]})
+
+    monkeypatch.setattr(tools._http, "get", get)
+
+    first = tools._search_pexels_videos("pizza", 5)
+    first[0]["tags"].append("edited")
+    first[0]["url"] = "edited"
+    first.append({"type": "video", "id": 2, "tags": []})
+
+    second = tools._search_pexels_videos("pizza", 5)
+    second[0]["description"] = "edited"
+
+    assert len(requests_made) == 1
+    assert tools._search_pexels_videos("pizza", 5) == [{
+        "type": "video",
+        "id": 1,
+        "url": "https://v/1.mp4",
+        "thumbnail": "https://v/1.jpg",
+        "duration": 8,
+        "tags": ["pizza"],
+        "description": "Stock video: pizza"
+    }]
+
+
+def _stub_pexels(tools, monkeypatch, page_size=None, shared_ids=()):
+    """Stub both Pexels searches; each returns page_size items (default: a full page)"""
+    requests_made = {}
+
+    def search(kind):
+        def run(term, per_page):
+            requests_made[(kind, term)] = per_page
+            count = per_page if page_size is None else min(page_size, per_page)
+            return [
+                {"type": kind, "id": "shared" if term in shared_ids and i == 0 else f"{term}-{i}", "tags": [term]}
+                for i in range(count)
+            ]
+        return run
+
+    monkeypatch.setattr(tools, "_search_pexels_videos", search("video"))
+    monkeypatch.setattr(tools, "_search_pexels_images", search("image"))
+    return requests_made
+
+
+def _ids(result):
+    return [(item["type"], item["id"]) for item in result["footage_suggestions"]]
+
+
+def test_search_stock_footage_full_pages_fill_in_one_wave(tools, monkeypatch):
+    requests_made = _stub_pexels(tools, monkeypatch)
+
+    result = tools.search_stock_footage(["pizza", "pasta", "wine", "dessert", "coffee"])
+
+    # 5 videos + 3 images per term until the 20-result budget runs out; the third
+    # term gets the last 4 slots as videos only, and later terms are never searched
+    assert requests_made == {
+        ("video", "pizza"): 5, ("image", "pizza"): 3,
+        ("video", "pasta"): 5, ("image", "pasta"): 3,
+        ("video", "wine"): 4,
+    }
+    assert _ids(result) == (
+        [("video", f"pizza-{i}") for i in range(5)] + [("image", f"pizza-{i}") for i in range(3)]
+        + [("video", f"pasta-{i}") for i in range(5)] + [("image", f"pasta-{i}") for i in range(3)]
+        + [("video", f"wine-{i}") for i in range(4)]
+    )
+    assert result["total_results"] == 20
+
+
+def test_search_stock_footage_short_pages_refill_in_later_waves(tools, monkeypatch):
+    requests_made = _stub_pexels(tools, monkeypatch, page_size=1)
+
+    result = tools.search_stock_footage(["pizza", "pasta", "wine", "dessert", "coffee"])
+
+    # The first wave assumes full pages; the 15 slots left after it go to the
+    # remaining terms in a second wave, sized to that budget
+    assert requests_made == {
+        ("video", "pizza"): 5, ("image", "pizza"): 3,
+        ("video", "pasta"): 5, ("image", "pasta"): 3,
+        ("video", "wine"): 4,
+        ("video", "dessert"): 5, ("image", "dessert"): 3,
+        ("video", "coffee"): 5, ("image", "coffee"): 2,
+    }
+    assert _ids(result) == [
+        ("video", "pizza-0"), ("image", "pizza-0"),
+        ("video", "pasta-0"), ("image", "pasta-0"),
+        ("video", "wine-0"),
+        ("video", "dessert-0"), ("image", "dessert-0"),
+        ("video", "coffee-0"), ("image", "coffee-0"),
+    ]
+
+
+def test_search_stock_footage_dedupes_terms_and_media(tools, monkeypatch):
+    requests_made = _stub_pexels(tools, monkeypatch, page_size=2, shared_ids=("pizza", "Pasta"))
+
+    result = tools.search_stock_footage(["pizza", " Pizza ", "", "Pasta"])
+
+    assert sorted(requests_made) == [("image", "Pasta"), ("image", "pizza"), ("video", "Pasta"), ("video", "pizza")]
+    assert _ids(result) == [
+        ("video", "shared"), ("video", "pizza-1"),
+        ("image", "shared"), ("image", "pizza-1"),
+        ("video", "Pasta-1"),
+        ("image", "Pasta-1"),
+    ]
+    assert result["search_terms_used"] == ["pizza", " Pizza ", "", "Pasta"]